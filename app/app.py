@@ -9,6 +9,8 @@ from flask_wtf.csrf import (
     CSRFError,
     CSRFProtect,
 )
+
+from database import init_db
 from routes.about import (
     about_blueprint,
 )
@@ -60,15 +62,16 @@ from routes.login import (
 from routes.logout import (
     logout_blueprint,
 )
+from routes.metrics import (
+    metrics_blueprint,
+)
 from routes.password_reset import (
     password_reset_blueprint,
 )
 from routes.post import post_blueprint
-
 from routes.privacy_policy import (
     privacy_policy_blueprint,
 )
-
 from routes.return_post_banner import (
     return_post_banner_blueprint,
 )
@@ -93,17 +96,16 @@ from routes.verify_user import (
 )
 from settings import Settings
 from utils.after_request import after_request_logger
+from utils.banner_processor import MODERN_FORMATS, start_banner_processor
 from utils.before_request.browser_language import browser_language
 from utils.context_processor.is_login import is_login
 from utils.context_processor.is_registration import is_registration
 from utils.context_processor.markdown import markdown_processor
-from utils.context_processor.return_post_url_id import return_post_url_id
 from utils.context_processor.return_post_url_slug import return_post_url_slug
 from utils.context_processor.return_user_profile_picture import (
     return_user_profile_picture,
 )
 from utils.context_processor.translations import inject_translations
-from database import init_db
 from utils.error_handlers.csrf_error_handler import (
     csrf_error_handler,
 )
@@ -114,9 +116,15 @@ from utils.error_handlers.unauthorized_error_handler import (
     unauthorized_error_handler,
 )
 from utils.generate_url_id_from_post import get_slug_from_post_title
+from utils.hot_score import start_hot_score_refresher
 from utils.log import Log
+from utils.metrics import record_request
+from utils.post_banner import post_banner_url
+from utils.request_timer import init_request_timer
 from utils.terminal_ascii import terminal_ascii
 from utils.time import current_time_stamp
+from utils.translations import install_reload_signal, reload_translations
+from utils.view_counter import start_view_count_flusher
 
 start_time = current_time_stamp()
 
@@ -136,6 +144,9 @@ app = Flask(
 app.jinja_options["autoescape"] = True
 
 
+init_request_timer(app)
+
+
 app.secret_key = Settings.APP_SECRET_KEY
 app.config["SESSION_PERMANENT"] = Settings.SESSION_PERMANENT
 
@@ -147,12 +158,15 @@ app.context_processor(is_login)
 
 app.context_processor(is_registration)
 app.context_processor(return_user_profile_picture)
-app.context_processor(return_post_url_id)
 app.context_processor(return_post_url_slug)
 app.context_processor(inject_translations)
 app.context_processor(markdown_processor)
 app.before_request(browser_language)
-app.jinja_env.globals.update(get_slug_from_post_title=get_slug_from_post_title)
+app.jinja_env.globals.update(
+    get_slug_from_post_title=get_slug_from_post_title,
+    post_banner_url=post_banner_url,
+    banner_formats=MODERN_FORMATS,
+)
 
 if Settings.WERKZEUG_LOGGER:
     Log.warning("Werkzeug default logger is enabled")
@@ -198,6 +212,13 @@ else:
 
 
 init_db(app)
+start_hot_score_refresher(app)
+start_view_count_flusher(app)
+start_banner_processor(app)
+reload_translations()
+
+if Settings.TRANSLATIONS_RELOAD_ON_SIGHUP:
+    install_reload_signal()
 
 
 @app.errorhandler(404)
@@ -218,6 +239,7 @@ def csrf_error(e):
 @app.after_request
 def after_request(response):
     response = after_request_logger(response)
+    record_request(response)
     response.headers["Content-Security-Policy"] = (
         "default-src 'self'; "
         "script-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://code.jquery.com https://cdn.tailwindcss.com; "
@@ -256,6 +278,7 @@ app.register_blueprint(account_settings_blueprint)
 app.register_blueprint(return_post_banner_blueprint)
 app.register_blueprint(admin_panel_comments_blueprint)
 app.register_blueprint(change_profile_picture_blueprint)
+app.register_blueprint(metrics_blueprint)
 
 
 if __name__ == "__main__":
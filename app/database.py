@@ -19,9 +19,16 @@ def init_db(app):
     with app.app_context():
         db.create_all()
         Log.success("Database tables created/verified")
+        _create_search_index()
         _create_default_admin()
 
 
+def _create_search_index():
+    from utils.post_search import create_post_search_index
+
+    create_post_search_index()
+
+
 def _create_default_admin():
     if not Settings.DEFAULT_ADMIN:
         return
@@ -1,5 +1,4 @@
 from sqlalchemy import func
-from sqlalchemy.ext.hybrid import hybrid_property
 
 from database import db
 from utils.time import current_time_stamp
@@ -18,6 +17,8 @@ class User(db.Model):
     time_stamp = db.Column(db.Integer, default=current_time_stamp)
     is_verified = db.Column(db.Text, default="False")
 
+    __table_args__ = (db.Index("ix_users_lower_username", func.lower(username)),)
+
     def __repr__(self):
         return f"<User {self.username}>"
 
@@ -26,17 +27,55 @@ class Post(db.Model):
     __tablename__ = "posts"
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
-    title = db.Column(db.Text, nullable=False)
+    title = db.Column(db.Text, nullable=False, index=True)
     tags = db.Column(db.Text, nullable=False)
     content = db.Column(db.Text, nullable=False)
-    banner = db.Column(db.LargeBinary, nullable=False)
+    content_html = db.Column(db.Text)
+    content_html_version = db.Column(db.Integer)
     author = db.Column(db.Text, nullable=False)
     views = db.Column(db.Integer, default=0)
     time_stamp = db.Column(db.Integer, default=current_time_stamp)
     last_edit_time_stamp = db.Column(db.Integer)
     category = db.Column(db.Text, nullable=False)
-    url_id = db.Column(db.Text, nullable=False)
+    url_id = db.Column(db.Text, nullable=False, index=True)
+    slug = db.Column(db.Text)
+    reading_time = db.Column(db.Integer)
     abstract = db.Column(db.Text, nullable=False, default="")
+    hot_score = db.Column(
+        db.Float, nullable=False, default=0.0, server_default="0", index=True
+    )
+
+    # Listings sort nullable columns as coalesce(column, 0), see
+    # utils.paginate.paginate_query_by_cursor.
+    __table_args__ = (
+        db.Index("ix_posts_coalesce_time_stamp", func.coalesce(time_stamp, 0)),
+        db.Index("ix_posts_coalesce_views", func.coalesce(views, 0)),
+        db.Index(
+            "ix_posts_coalesce_last_edit_time_stamp",
+            func.coalesce(last_edit_time_stamp, 0),
+        ),
+        db.Index(
+            "ix_posts_author_coalesce_time_stamp",
+            author,
+            func.coalesce(time_stamp, 0),
+        ),
+        db.Index(
+            "ix_posts_lower_category_coalesce_time_stamp",
+            func.lower(category),
+            func.coalesce(time_stamp, 0),
+        ),
+        db.Index("ix_posts_lower_category_title", func.lower(category), title),
+        db.Index(
+            "ix_posts_lower_category_coalesce_views",
+            func.lower(category),
+            func.coalesce(views, 0),
+        ),
+        db.Index(
+            "ix_posts_lower_category_coalesce_last_edit_time_stamp",
+            func.lower(category),
+            func.coalesce(last_edit_time_stamp, 0),
+        ),
+    )
 
     comments = db.relationship(
         "Comment",
@@ -45,22 +84,45 @@ class Post(db.Model):
         cascade="all, delete-orphan",
     )
 
-    @hybrid_property
-    def hot_score(self):
-        age_hours = (current_time_stamp() - self.time_stamp) / 3600
-        gravity = 1.8
-        return (self.views or 0) / ((age_hours + 2) ** gravity)
-
-    @hot_score.expression
-    def hot_score(cls):
-        age_hours = (func.strftime("%s", "now") - cls.time_stamp) / 3600.0
-        gravity = 1.8
-        return func.coalesce(cls.views, 0) / func.pow(age_hours + 2, gravity)
+    banner = db.relationship(
+        "PostBanner",
+        uselist=False,
+        lazy="select",
+        cascade="all, delete-orphan",
+    )
 
     def __repr__(self):
         return f"<Post {self.title}>"
 
 
+class PostBanner(db.Model):
+    __tablename__ = "post_banners"
+
+    post_id = db.Column(
+        db.Integer,
+        db.ForeignKey("posts.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    hash = db.Column(db.String(64))
+    mimetype = db.Column(db.String(32))
+
+    def __repr__(self):
+        return f"<PostBanner of Post {self.post_id}>"
+
+
+class BannerVariant(db.Model):
+    __tablename__ = "banner_variants"
+
+    source_hash = db.Column(db.String(64), primary_key=True)
+    variant = db.Column(db.String(16), primary_key=True)
+    format = db.Column(db.String(8), primary_key=True)
+    width = db.Column(db.Integer, nullable=False)
+    mimetype = db.Column(db.String(32), nullable=False)
+
+    def __repr__(self):
+        return f"<BannerVariant {self.variant}.{self.format} of {self.source_hash}>"
+
+
 class Comment(db.Model):
     __tablename__ = "comments"
 
@@ -70,5 +132,13 @@ class Comment(db.Model):
     username = db.Column(db.Text)
     time_stamp = db.Column(db.Integer, default=current_time_stamp)
 
+    __table_args__ = (
+        db.Index("ix_comments_post_id_time_stamp", post_id, time_stamp),
+        db.Index("ix_comments_coalesce_time_stamp", func.coalesce(time_stamp, 0)),
+        db.Index(
+            "ix_comments_lower_username_time_stamp", func.lower(username), time_stamp
+        ),
+    )
+
     def __repr__(self):
         return f"<Comment {self.id} on Post {self.post_id}>"
@@ -7,8 +7,9 @@ from flask import (
 )
 
 from models import Comment
+from utils.comment_rows import select_comment_rows
 from utils.log import Log
-from utils.paginate import paginate_query
+from utils.paginate import paginate_query_by_cursor
 
 admin_panel_comments_blueprint = Blueprint("admin_panel_comments", __name__)
 
@@ -18,13 +19,12 @@ def admin_panel_comments():
     if "username" in session:
         Log.info(f"Admin: {session['username']} reached to comments admin panel")
 
-        query = Comment.query.order_by(Comment.time_stamp.desc())
-        comments_objects, page, total_pages = paginate_query(query)
-
-        comments = [
-            (c.id, c.post_id, c.comment, c.username, c.time_stamp)
-            for c in comments_objects
-        ]
+        comments, page, total_pages, cursors = paginate_query_by_cursor(
+            select_comment_rows(),
+            Comment.time_stamp,
+            Comment.id,
+            count_key="comments",
+        )
 
         Log.info(
             f"Rendering admin_panel_comments.html: params: comments={len(comments)}"
@@ -35,6 +35,7 @@ def admin_panel_comments():
             comments=comments,
             page=page,
             total_pages=total_pages,
+            cursors=cursors,
         )
     else:
         Log.error(
@@ -7,8 +7,10 @@ from flask import (
 )
 
 from models import Post
+from utils.count_cache import posts_count_key
 from utils.log import Log
-from utils.paginate import paginate_query
+from utils.paginate import paginate_query_by_cursor
+from utils.post_html import select_post_excerpts, to_post_excerpt_rows
 
 admin_panel_posts_blueprint = Blueprint("admin_panel_posts", __name__)
 
@@ -18,26 +20,14 @@ def admin_panel_posts():
     if "username" in session:
         Log.info(f"Admin: {session['username']} reached to posts admin panel")
 
-        query = Post.query.order_by(Post.time_stamp.desc())
-        posts_objects, page, total_pages = paginate_query(query)
-
-        posts = [
-            (
-                p.id,
-                p.title,
-                p.tags,
-                p.content,
-                p.banner,
-                p.author,
-                p.views,
-                p.time_stamp,
-                p.last_edit_time_stamp,
-                p.category,
-                p.url_id,
-                p.abstract,
-            )
-            for p in posts_objects
-        ]
+        rows, page, total_pages, cursors = paginate_query_by_cursor(
+            select_post_excerpts(),
+            Post.time_stamp,
+            Post.id,
+            count_key=posts_count_key(),
+        )
+
+        posts = to_post_excerpt_rows(rows)
 
         Log.info(
             f"Rendering dashboard.html: params: posts={len(posts)} and show_posts=True"
@@ -49,6 +39,7 @@ def admin_panel_posts():
             show_posts=True,
             page=page,
             total_pages=total_pages,
+            cursors=cursors,
         )
     else:
         Log.error(
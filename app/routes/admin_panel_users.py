@@ -10,7 +10,7 @@ from models import User
 from utils.change_user_role import change_user_role
 from utils.delete import delete_user
 from utils.log import Log
-from utils.paginate import paginate_query
+from utils.paginate import paginate_query_by_cursor
 
 admin_panel_users_blueprint = Blueprint("admin_panel_users", __name__)
 
@@ -41,8 +41,13 @@ def admin_panel_users():
                 change_user_role(request.form["username"])
 
         if user.role == "admin":
-            query = User.query
-            users_objects, page, total_pages = paginate_query(query)
+            users_objects, page, total_pages, cursors = paginate_query_by_cursor(
+                User.query,
+                User.user_id,
+                User.user_id,
+                descending=False,
+                count_key="users",
+            )
 
             users = [
                 (
@@ -66,6 +71,7 @@ def admin_panel_users():
                 users=users,
                 page=page,
                 total_pages=total_pages,
+                cursors=cursors,
             )
         else:
             Log.error(
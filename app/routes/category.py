@@ -2,20 +2,24 @@
 This module contains the route for category pages.
 """
 
-from json import load
-
 from flask import Blueprint, abort, redirect, render_template, session
 from sqlalchemy import func
 
 from models import Post
+from utils.count_cache import posts_count_key
+from utils.get_profile_picture import preload_profile_pictures
 from utils.log import Log
-from utils.paginate import paginate_query
+from utils.page_cache import cache_page
+from utils.paginate import paginate_query_by_cursor
+from utils.post_cards import select_post_cards, to_post_cards
+from utils.translations import load_translations
 
 category_blueprint = Blueprint("category", __name__)
 
 
 @category_blueprint.route("/category/<category>")
 @category_blueprint.route("/category/<category>/by=<by>/sort=<sort>")
+@cache_page
 def category(category, by="time_stamp", sort="desc"):
     categories = [
         "games",
@@ -53,33 +57,18 @@ def category(category, by="time_stamp", sort="desc"):
     if category.lower() not in categories:
         abort(404)
 
-    base_query = Post.query.filter(func.lower(Post.category) == category.lower())
-
-    sort_field = getattr(Post, by)
-    if sort == "desc":
-        query = base_query.order_by(sort_field.desc())
-    else:
-        query = base_query.order_by(sort_field.asc())
-
-    posts_objects, page, total_pages = paginate_query(query)
-
-    posts = [
-        (
-            p.id,
-            p.title,
-            p.tags,
-            p.content,
-            p.banner,
-            p.author,
-            p.views,
-            p.time_stamp,
-            p.last_edit_time_stamp,
-            p.category,
-            p.url_id,
-            p.abstract,
-        )
-        for p in posts_objects
-    ]
+    query = select_post_cards().where(func.lower(Post.category) == category.lower())
+
+    rows, page, total_pages, cursors = paginate_query_by_cursor(
+        query,
+        getattr(Post, by),
+        Post.id,
+        descending=sort == "desc",
+        count_key=posts_count_key(category=category),
+    )
+
+    posts = to_post_cards(rows)
+    preload_profile_pictures(post.author for post in posts)
 
     display_by = by
     if by == "time_stamp":
@@ -88,9 +77,7 @@ def category(category, by="time_stamp", sort="desc"):
         display_by = "edit"
 
     language = session.get("language")
-    translation_file = f"./translations/{language}.json"
-    with open(translation_file, "r", encoding="utf-8") as file:
-        translations = load(file)
+    translations = load_translations(language)
 
     sort_name = (
         translations["sort_menu"][display_by] + " - " + translations["sort_menu"][sort]
@@ -106,4 +93,5 @@ def category(category, by="time_stamp", sort="desc"):
         source=f"/category/{category}",
         page=page,
         total_pages=total_pages,
+        cursors=cursors,
     )
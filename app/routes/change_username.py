@@ -9,9 +9,11 @@ from sqlalchemy import func
 
 from database import db
 from models import Comment, Post, User
+from utils.count_cache import invalidate_count, posts_count_key
 from utils.flash_message import flash_message
 from utils.forms.change_user_name_form import ChangeUserNameForm
 from utils.log import Log
+from utils.page_cache import invalidate_page_cache
 
 change_username_blueprint = Blueprint("change_username", __name__)
 
@@ -61,6 +63,12 @@ def change_username():
 
                 db.session.commit()
 
+                invalidate_count(
+                    posts_count_key(author=old_username),
+                    posts_count_key(author=new_username),
+                )
+                invalidate_page_cache()
+
                 Log.success(
                     f"User: {old_username} changed his username to {new_username}",
                 )
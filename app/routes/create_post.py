@@ -9,10 +9,16 @@ from flask import (
 from database import db
 from models import Post
 from utils.add_points import add_points
+from utils.banner_processor import enqueue_banner, process_fallback_banner
+from utils.calculate_read_time import calculate_read_time
+from utils.count_cache import adjust_count, post_count_keys
 from utils.flash_message import flash_message
 from utils.forms.create_post_form import CreatePostForm
-from utils.generate_url_id_from_post import generate_url_id
+from utils.generate_url_id_from_post import generate_url_id, get_slug_from_post_title
 from utils.log import Log
+from utils.page_cache import invalidate_page_cache
+from utils.post_banner import set_post_banner
+from utils.post_html import render_post_html
 from utils.time import current_time_stamp
 
 create_post_blueprint = Blueprint("create_post", __name__)
@@ -59,17 +65,26 @@ def create_post():
                     title=post_title,
                     tags=post_tags,
                     content=post_content,
-                    banner=post_banner,
                     author=session["username"],
                     views=0,
                     time_stamp=current_time_stamp(),
                     last_edit_time_stamp=current_time_stamp(),
                     category=post_category,
                     url_id=generate_url_id(),
+                    slug=get_slug_from_post_title(post_title),
+                    reading_time=calculate_read_time(post_content),
                     abstract=post_abstract,
                 )
+                render_post_html(new_post)
+                if post_banner:
+                    set_post_banner(new_post, post_banner)
                 db.session.add(new_post)
                 db.session.commit()
+                adjust_count(1, *post_count_keys(post_category, session["username"]))
+                invalidate_page_cache()
+                if new_post.banner:
+                    process_fallback_banner(new_post.banner.hash)
+                    enqueue_banner(new_post.banner.hash)
 
                 Log.success(
                     f'Post: "{post_title}" posted by "{session["username"]}"',
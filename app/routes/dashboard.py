@@ -1,5 +1,3 @@
-from json import load
-
 from flask import (
     Blueprint,
     redirect,
@@ -11,10 +9,14 @@ from flask import (
 from sqlalchemy import func
 
 from models import Comment, Post
+from utils.comment_rows import get_comment_rows, select_comment_rows
+from utils.count_cache import posts_count_key
 from utils.delete import delete_post
 from utils.flash_message import flash_message
 from utils.log import Log
-from utils.paginate import paginate_query
+from utils.paginate import paginate_query_by_cursor
+from utils.post_html import select_post_excerpts, to_post_excerpt_rows
+from utils.translations import load_translations
 
 dashboard_blueprint = Blueprint("dashboard", __name__)
 
@@ -32,51 +34,30 @@ def dashboard(username):
                         301,
                     )
 
-            query = Post.query.filter_by(author=session["username"]).order_by(
-                Post.time_stamp.desc()
+            query = select_post_excerpts().where(Post.author == session["username"])
+            rows, page, total_pages, cursors = paginate_query_by_cursor(
+                query,
+                Post.time_stamp,
+                Post.id,
+                count_key=posts_count_key(author=session["username"]),
             )
-            posts_objects, page, total_pages = paginate_query(query)
 
-            posts = [
-                [
-                    p.id,
-                    p.title,
-                    p.tags,
-                    p.content,
-                    p.banner,
-                    p.author,
-                    p.views,
-                    p.time_stamp,
-                    p.last_edit_time_stamp,
-                    p.category,
-                    p.url_id,
-                    p.abstract,
-                ]
-                for p in posts_objects
-            ]
+            posts = to_post_excerpt_rows(rows)
 
-            comments_objects = (
-                Comment.query.filter(func.lower(Comment.username) == username.lower())
+            comments = get_comment_rows(
+                select_comment_rows()
+                .where(func.lower(Comment.username) == username.lower())
                 .order_by(Comment.time_stamp.desc())
-                .all()
             )
 
-            comments = [
-                (c.id, c.post_id, c.comment, c.username, c.time_stamp)
-                for c in comments_objects
-            ]
-
             show_posts = len(posts) > 0
             show_comments = len(comments) > 0
 
             language = session.get("language")
-            translation_file = f"./translations/{language}.json"
-
-            with open(translation_file, "r", encoding="utf-8") as file:
-                translations = load(file)
+            translations = load_translations(language)
 
             for post in posts:
-                post[9] = translations["categories"][post[9].lower()]
+                post[8] = translations["categories"][post[8].lower()]
 
             return render_template(
                 "/dashboard.html",
@@ -86,6 +67,7 @@ def dashboard(username):
                 show_comments=show_comments,
                 page=page,
                 total_pages=total_pages,
+                cursors=cursors,
             )
         else:
             Log.error(
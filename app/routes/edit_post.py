@@ -8,9 +8,17 @@ from flask import (
 
 from database import db
 from models import Post
+from utils.banner_processor import enqueue_banner, process_fallback_banner
+from utils.calculate_read_time import calculate_read_time
+from utils.count_cache import adjust_count, posts_count_key
 from utils.flash_message import flash_message
 from utils.forms.create_post_form import CreatePostForm
+from utils.generate_url_id_from_post import get_slug_from_post_title
+from utils.hot_score import calculate_hot_score
 from utils.log import Log
+from utils.page_cache import invalidate_page_cache
+from utils.post_banner import set_post_banner
+from utils.post_html import render_post_html
 from utils.time import current_time_stamp
 
 edit_post_blueprint = Blueprint("edit_post", __name__)
@@ -68,19 +76,36 @@ def edit_post(url_id):
                             f'User: "{session["username"]}" tried to edit a post with empty content',
                         )
                     else:
+                        old_category = post.category
+
                         post.title = post_title
+                        post.slug = get_slug_from_post_title(post_title)
                         post.tags = post_tags
                         post.content = post_content
+                        post.reading_time = calculate_read_time(post_content)
+                        render_post_html(post)
                         post.abstract = post_abstract
                         post.category = post_category
 
                         if post_banner != b"":
-                            post.banner = post_banner
+                            set_post_banner(post, post_banner)
 
                         post.last_edit_time_stamp = current_time_stamp()
+                        post.hot_score = calculate_hot_score(
+                            post.views, post.time_stamp
+                        )
 
                         db.session.commit()
 
+                        if old_category.lower() != post_category.lower():
+                            adjust_count(-1, posts_count_key(category=old_category))
+                            adjust_count(1, posts_count_key(category=post_category))
+
+                        invalidate_page_cache()
+                        if post_banner != b"":
+                            process_fallback_banner(post.banner.hash)
+                            enqueue_banner(post.banner.hash)
+
                         Log.success(f'Post: "{post_title}" edited')
                         flash_message(
                             page="edit_post",
@@ -96,6 +121,7 @@ def edit_post(url_id):
                     title=post.title,
                     tags=post.tags,
                     content=post.content,
+                    banner_hash=post.banner.hash if post.banner else None,
                     form=form,
                 )
             else:
@@ -11,19 +11,23 @@ The posts variable is passed to the index.html template as a list of dictionarie
 The index.html template displays the title and content of each post.
 """
 
-from json import load
-
 from flask import Blueprint, redirect, render_template, session
 
 from models import Post
+from utils.count_cache import posts_count_key
+from utils.get_profile_picture import preload_profile_pictures
 from utils.log import Log
-from utils.paginate import paginate_query
+from utils.page_cache import cache_page
+from utils.paginate import paginate_query_by_cursor
+from utils.post_cards import select_post_cards, to_post_cards
+from utils.translations import load_translations
 
 index_blueprint = Blueprint("index", __name__)
 
 
 @index_blueprint.route("/")
 @index_blueprint.route("/by=<by>/sort=<sort>")
+@cache_page
 def index(by="hot", sort="desc"):
     by_options = [
         "time_stamp",
@@ -41,37 +45,18 @@ def index(by="hot", sort="desc"):
         )
         return redirect("/")
 
-    if by == "hot":
-        if sort == "desc":
-            query = Post.query.order_by(Post.hot_score.desc())
-        else:
-            query = Post.query.order_by(Post.hot_score.asc())
-    else:
-        sort_field = getattr(Post, by)
-        if sort == "desc":
-            query = Post.query.order_by(sort_field.desc())
-        else:
-            query = Post.query.order_by(sort_field.asc())
-
-    posts_objects, page, total_pages = paginate_query(query)
-
-    posts = [
-        (
-            p.id,
-            p.title,
-            p.tags,
-            p.content,
-            p.banner,
-            p.author,
-            p.views,
-            p.time_stamp,
-            p.last_edit_time_stamp,
-            p.category,
-            p.url_id,
-            p.abstract,
-        )
-        for p in posts_objects
-    ]
+    sort_field = Post.hot_score if by == "hot" else getattr(Post, by)
+
+    rows, page, total_pages, cursors = paginate_query_by_cursor(
+        select_post_cards(),
+        sort_field,
+        Post.id,
+        descending=sort == "desc",
+        count_key=posts_count_key(),
+    )
+
+    posts = to_post_cards(rows)
+    preload_profile_pictures(post.author for post in posts)
 
     display_by = by
     if by == "time_stamp":
@@ -80,9 +65,7 @@ def index(by="hot", sort="desc"):
         display_by = "edit"
 
     language = session.get("language")
-    translation_file = f"./translations/{language}.json"
-    with open(translation_file, "r", encoding="utf-8") as file:
-        translations = load(file)
+    translations = load_translations(language)
 
     translations = translations["sort_menu"]
 
@@ -97,4 +80,5 @@ def index(by="hot", sort="desc"):
         source="",
         page=page,
         total_pages=total_pages,
+        cursors=cursors,
     )
@@ -14,6 +14,7 @@ from utils.add_points import add_points
 from utils.flash_message import flash_message
 from utils.forms.login_form import LoginForm
 from utils.log import Log
+from utils.metrics import observe_duration
 
 login_blueprint = Blueprint("login", __name__)
 
@@ -60,7 +61,10 @@ def login(direct):
                         language=session["language"],
                     )
                 else:
-                    if encryption.verify(password, user.password):
+                    with observe_duration("flaskblog_login_hash_duration_seconds"):
+                        password_matches = encryption.verify(password, user.password)
+
+                    if password_matches:
                         session["username"] = user.username
                         session["user_role"] = user.role
                         add_points(1, session["username"])
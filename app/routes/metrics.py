@@ -0,0 +1,53 @@
+from flask import Blueprint, abort, request, session
+
+from models import User
+from settings import Settings
+from utils.log import Log
+from utils.metrics import collect_metrics, render_metrics
+
+metrics_blueprint = Blueprint("metrics", __name__)
+
+
+def _is_allowed():
+    allowed_addresses = {
+        address.strip()
+        for address in Settings.METRICS_ALLOWED_ADDRESSES.split(",")
+        if address.strip()
+    }
+
+    if request.remote_addr in allowed_addresses:
+        return True
+
+    if "username" in session:
+        user = User.query.filter_by(username=session["username"]).first()
+
+        return user is not None and user.role == "admin"
+
+    return False
+
+
+@metrics_blueprint.route("/metrics")
+def metrics():
+    """
+    This function returns the metrics of every worker in the Prometheus text
+    format, to admins and to the addresses in METRICS_ALLOWED_ADDRESSES.
+
+    Returns:
+        tuple: The metrics, the status code and the content type header.
+
+    Raises:
+        403: If the client is neither an admin nor an allowed address.
+        404: If metrics are disabled.
+    """
+    if not Settings.METRICS:
+        abort(404)
+
+    if not _is_allowed():
+        Log.error(f"{request.remote_addr} tried to reach metrics without being allowed")
+        abort(403)
+
+    return (
+        render_metrics(collect_metrics()),
+        200,
+        {"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+    )
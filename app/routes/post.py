@@ -1,5 +1,6 @@
 from flask import (
     Blueprint,
+    make_response,
     redirect,
     render_template,
     request,
@@ -13,34 +14,43 @@ from models import Comment, Post
 from settings import Settings
 from utils.add_points import add_points
 from utils.calculate_read_time import calculate_read_time
+from utils.conditional_get import (
+    is_not_modified,
+    not_modified_response,
+    post_etag,
+    set_validators,
+)
+from utils.count_cache import adjust_count
 from utils.delete import delete_comment, delete_post
 from utils.flash_message import flash_message
 from utils.forms.comment_form import CommentForm
 from utils.generate_url_id_from_post import get_slug_from_post_title
+from utils.get_profile_picture import preload_profile_pictures
 from utils.log import Log
+from utils.page_cache import cache_page, invalidate_post_pages, mark_post_page
+from utils.post_html import get_post_html
 from utils.time import current_time_stamp
+from utils.view_counter import get_pending_views, record_view
 
 post_blueprint = Blueprint("post", __name__)
 
 
 @post_blueprint.route("/post/<url_id>", methods=["GET", "POST"])
 @post_blueprint.route("/post/<slug>-<url_id>", methods=["GET", "POST"])
+@cache_page
 def post(url_id=None, slug=None):
     form = CommentForm(request.form)
 
     post = Post.query.filter_by(url_id=url_id).first()
 
     if post:
-        post_slug = get_slug_from_post_title(post.title)
+        post_slug = post.slug or get_slug_from_post_title(post.title)
 
         if slug != post_slug:
             return redirect(url_for("post.post", url_id=url_id, slug=post_slug))
 
         Log.success(f'post: "{url_id}" loaded')
 
-        post.views = (post.views or 0) + 1
-        db.session.commit()
-
         if request.method == "POST":
             if "post_delete_button" in request.form:
                 delete_post(post.id)
@@ -60,6 +70,8 @@ def post(url_id=None, slug=None):
             )
             db.session.add(new_comment)
             db.session.commit()
+            adjust_count(1, "comments")
+            invalidate_post_pages(post.id)
 
             Log.success(
                 f'User: "{session["username"]}" commented to post: "{url_id}"',
@@ -76,6 +88,14 @@ def post(url_id=None, slug=None):
 
             return redirect(url_for("post.post", url_id=url_id)), 301
 
+        record_view(post.id)
+        mark_post_page(post.id)
+
+        etag = post_etag(post)
+
+        if is_not_modified(etag):
+            return not_modified_response(etag)
+
         comments = (
             Comment.query.filter_by(post_id=post.id)
             .order_by(Comment.time_stamp.desc())
@@ -86,25 +106,33 @@ def post(url_id=None, slug=None):
             (c.id, c.post_id, c.comment, c.username, c.time_stamp) for c in comments
         ]
 
-        return render_template(
-            "post.html",
-            id=post.id,
-            title=post.title,
-            tags=post.tags,
-            abstract=post.abstract,
-            content=post.content,
-            author=post.author,
-            views=post.views,
-            time_stamp=post.time_stamp,
-            last_edit_time_stamp=post.last_edit_time_stamp,
-            url_id=post.url_id,
-            form=form,
-            comments=comments_tuples,
-            app_name=Settings.APP_NAME,
-            blog_post_url=request.root_url,
-            reading_time=calculate_read_time(post.content),
+        preload_profile_pictures([post.author, *(c.username for c in comments)])
+
+        response = make_response(
+            render_template(
+                "post.html",
+                id=post.id,
+                title=post.title,
+                tags=post.tags,
+                abstract=post.abstract,
+                content=post.content,
+                content_html=get_post_html(post),
+                author=post.author,
+                views=(post.views or 0) + get_pending_views(post.id),
+                time_stamp=post.time_stamp,
+                last_edit_time_stamp=post.last_edit_time_stamp,
+                url_id=post.url_id,
+                banner_hash=post.banner.hash if post.banner else None,
+                form=form,
+                comments=comments_tuples,
+                app_name=Settings.APP_NAME,
+                blog_post_url=request.root_url,
+                reading_time=post.reading_time or calculate_read_time(post.content),
+            )
         )
 
+        return set_validators(response, etag)
+
     else:
         Log.error(f"{request.remote_addr} tried to reach unknown post")
         return render_template("not_found.html")
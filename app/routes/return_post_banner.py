@@ -1,32 +1,131 @@
-from io import BytesIO
+from flask import (
+    Blueprint,
+    abort,
+    make_response,
+    redirect,
+    request,
+    url_for,
+)
+from sqlalchemy import select
 
-from flask import Blueprint, abort, request, send_file
-
-from models import Post
+from database import db
+from models import BannerVariant, PostBanner
+from utils.banner_processor import (
+    FALLBACK_FORMATS,
+    MODERN_FORMATS,
+    STRIPPED_VARIANT,
+    VARIANT_WIDTHS,
+)
+from utils.banner_storage import banner_file_exists, banner_file_name, send_banner_file
 from utils.log import Log
 
 return_post_banner_blueprint = Blueprint("return_post_banner", __name__)
 
+# Hashed banner URLs never change content, unhashed ones and the fallbacks
+# sent for variants that are not processed yet must be revalidated.
+IMMUTABLE_MAX_AGE = 31536000
+
+
+def _find_variant(banner_hash, variant, formats):
+    return db.session.execute(
+        select(BannerVariant.format, BannerVariant.mimetype).where(
+            BannerVariant.source_hash == banner_hash,
+            BannerVariant.variant == variant,
+            BannerVariant.format.in_(formats),
+        )
+    ).first()
+
 
 @return_post_banner_blueprint.route("/post-image/<int:post_id>")
-def return_post_banner(post_id):
+@return_post_banner_blueprint.route("/post-image/<int:post_id>/<banner_hash>")
+def return_post_banner(post_id, banner_hash=None):
     """
     This function returns the banner image for a given post ID.
 
+    The variant and format query parameters select a resized, re-encoded
+    variant of the banner, the original size in the JPEG or PNG fallback
+    format when omitted. Until the variant is processed the original size
+    fallback, or the metadata stripped copy made on upload, is sent instead
+    and must be revalidated. The uploaded file is never sent, it may carry
+    EXIF and other metadata.
+
+    Banners requested with their content hash are cached by clients for a
+    year, banners requested without it are revalidated with their ETag.
+    A hash that is no longer current redirects to the current banner.
+
     Args:
         post_id (int): The ID of the post for which the banner image is requested.
+        banner_hash (str, optional): The content hash of the banner.
 
     Returns:
         The banner image for the given post ID as a Flask Response object.
 
+    Raises:
+        404: If the post has no banner or no variant of it is processed yet.
     """
-    post = Post.query.get(post_id)
+    variant = request.args.get("variant", "original")
+    image_format = request.args.get("format")
+
+    if variant not in VARIANT_WIDTHS:
+        abort(404)
+
+    if image_format is not None and image_format not in MODERN_FORMATS:
+        abort(404)
+
+    banner = db.session.execute(
+        select(PostBanner.hash).where(PostBanner.post_id == post_id)
+    ).first()
+
+    if not banner or not banner.hash:
+        abort(404)
+
+    if banner_hash is not None and banner_hash != banner.hash:
+        return redirect(
+            url_for(
+                "return_post_banner.return_post_banner",
+                post_id=post_id,
+                banner_hash=banner.hash,
+                **request.args,
+            )
+        )
+
+    formats = (image_format,) if image_format else FALLBACK_FORMATS
+    banner_variant = _find_variant(banner.hash, variant, formats)
+    is_fallback = banner_variant is None
+
+    # Until the worker has made the variant, send the original size fallback
+    # or, before that exists, the stripped copy made on upload.
+    for fallback_variant in ("original", STRIPPED_VARIANT):
+        if banner_variant is not None:
+            break
+
+        variant = fallback_variant
+        banner_variant = _find_variant(banner.hash, variant, FALLBACK_FORMATS)
+
+    if banner_variant is None:
+        Log.warning(f"Post: {post_id} | Banner is not processed yet")
+        abort(404)
+
+    etag = f"{banner.hash}-{variant}-{banner_variant.format}"
+    file_name = banner_file_name(banner.hash, variant, banner_variant.format)
 
-    if not post or not post.banner:
+    if request.if_none_match.contains(etag):
+        response = make_response("", 304)
+        response.set_etag(etag)
+    elif banner_file_exists(file_name):
+        response = send_banner_file(file_name, banner_variant.mimetype, etag)
+    else:
+        Log.error(f"Post: {post_id} | Banner file {file_name} is missing")
         abort(404)
 
-    image = BytesIO(post.banner)
+    if banner_hash is None or is_fallback:
+        response.cache_control.no_cache = True
+    else:
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = IMMUTABLE_MAX_AGE
+        response.cache_control.immutable = True
 
-    Log.info(f"Post: {post_id} | Image: {request.base_url} loaded")
+    Log.info("Post: %s | Image: %s loaded", post_id, request.full_path)
 
-    return send_file(image, mimetype="image/png")
+    return response
@@ -1,9 +1,9 @@
-from math import ceil
-
 from flask import Blueprint, render_template, request
 
-from models import Post, User
+from models import User
+from utils.get_profile_picture import preload_profile_pictures
 from utils.log import Log
+from utils.post_search import search_posts
 
 search_blueprint = Blueprint("search", __name__)
 
@@ -25,80 +25,11 @@ def search(query):
     ).all()
     all_users = list(set(query_users + query_users_no_space))
 
-    query_tags = (
-        Post.query.filter(Post.tags.ilike(f"%{query}%"))
-        .order_by(Post.time_stamp.desc())
-        .all()
-    )
-    query_tags_no_space = (
-        Post.query.filter(Post.tags.ilike(f"%{query_no_white_space}%"))
-        .order_by(Post.time_stamp.desc())
-        .all()
-    )
-
-    query_titles = (
-        Post.query.filter(Post.title.ilike(f"%{query}%"))
-        .order_by(Post.time_stamp.desc())
-        .all()
-    )
-    query_titles_no_space = (
-        Post.query.filter(Post.title.ilike(f"%{query_no_white_space}%"))
-        .order_by(Post.time_stamp.desc())
-        .all()
-    )
-
-    query_authors = (
-        Post.query.filter(Post.author.ilike(f"%{query}%"))
-        .order_by(Post.time_stamp.desc())
-        .all()
-    )
-    query_authors_no_space = (
-        Post.query.filter(Post.author.ilike(f"%{query_no_white_space}%"))
-        .order_by(Post.time_stamp.desc())
-        .all()
-    )
-
-    all_posts_set = set()
-    posts_ordered = []
-
-    for post in (
-        query_tags
-        + query_tags_no_space
-        + query_titles
-        + query_titles_no_space
-        + query_authors
-        + query_authors_no_space
-    ):
-        if post.id not in all_posts_set:
-            all_posts_set.add(post.id)
-            posts_ordered.append(post)
+    posts, total_pages = search_posts(query, page=max(page, 1), per_page=per_page)
 
-    empty = not posts_ordered and not all_users
+    empty = not posts and not all_users
 
-    total_posts = len(posts_ordered)
-    total_pages = max(ceil(total_posts / per_page), 1)
-    offset = (page - 1) * per_page
-    paginated_posts = posts_ordered[offset : offset + per_page]
-
-    posts = [
-        [
-            (
-                p.id,
-                p.title,
-                p.tags,
-                p.content,
-                p.banner,
-                p.author,
-                p.views,
-                p.time_stamp,
-                p.last_edit_time_stamp,
-                p.category,
-                p.url_id,
-                p.abstract,
-            ),
-        ]
-        for p in paginated_posts
-    ]
+    preload_profile_pictures(post.author for post in posts)
 
     users = []
     if all_users:
@@ -16,6 +16,7 @@ from database import db
 from models import User
 from settings import Settings
 from utils.add_points import add_points
+from utils.count_cache import adjust_count
 from utils.flash_message import flash_message
 from utils.forms.sign_up_form import SignUpForm
 from utils.log import Log
@@ -81,6 +82,7 @@ def signup():
                             )
                             db.session.add(new_user)
                             db.session.commit()
+                            adjust_count(1, "users")
 
                             Log.success(f'User: "{username}" added to database')
 
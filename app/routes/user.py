@@ -6,7 +6,10 @@ from flask import Blueprint, render_template
 from sqlalchemy import func
 
 from models import Comment, Post, User
+from utils.comment_rows import get_comment_rows, select_comment_rows
+from utils.get_profile_picture import preload_profile_pictures
 from utils.log import Log
+from utils.post_cards import get_post_cards, select_post_cards
 
 user_blueprint = Blueprint("user", __name__)
 
@@ -20,17 +23,19 @@ def user(username):
     if user:
         Log.success(f'User: "{username}" found')
 
-        posts = (
-            Post.query.filter_by(author=user.username)
-            .order_by(Post.time_stamp.desc())
-            .all()
+        posts = get_post_cards(
+            select_post_cards()
+            .where(Post.author == user.username)
+            .order_by(func.coalesce(Post.time_stamp, 0).desc())
         )
 
+        preload_profile_pictures(post.author for post in posts)
+
         views = sum(post.views or 0 for post in posts)
 
-        comments = Comment.query.filter(
-            func.lower(Comment.username) == username_lower
-        ).all()
+        comments = get_comment_rows(
+            select_comment_rows().where(func.lower(Comment.username) == username_lower)
+        )
 
         show_posts = len(posts) > 0
         show_comments = len(comments) > 0
@@ -49,34 +54,12 @@ def user(username):
             user.is_verified,
         )
 
-        posts_tuples = [
-            (
-                p.id,
-                p.title,
-                p.tags,
-                p.content,
-                p.banner,
-                p.author,
-                p.views,
-                p.time_stamp,
-                p.last_edit_time_stamp,
-                p.category,
-                p.url_id,
-                p.abstract,
-            )
-            for p in posts
-        ]
-
-        comments_tuples = [
-            (c.id, c.post_id, c.comment, c.username, c.time_stamp) for c in comments
-        ]
-
         return render_template(
             "user.html",
             user=user_tuple,
             views=views,
-            posts=posts_tuples,
-            comments=comments_tuples,
+            posts=posts,
+            comments=comments,
             show_posts=show_posts,
             show_comments=show_comments,
         )
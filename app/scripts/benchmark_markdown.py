@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for the markdown renderer under concurrent use.
+
+Renders a long sample post from a growing number of threads, once with the
+per-thread renderers used by the app and once with a single shared renderer
+behind a lock, and prints the renders per second of each. The same number of
+worker processes is run as a reference, since under the GIL pure Python
+rendering only scales across processes (WSGI workers) or on a free threaded
+interpreter. Every rendered document is compared with a single threaded
+render to catch renderers that leak state between threads.
+
+Usage:
+    cd /path/to/flaskBlog/app
+    python scripts/benchmark_markdown.py [--renders 400] [--threads 1,2,4,8]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from threading import Lock
+from time import perf_counter
+
+from utils.markdown_renderer import SafeMarkdownRenderer, render_markdown
+
+
+def sample_post(sections=20):
+    """
+    Returns a long markdown document that uses every enabled extra.
+    """
+    parts = []
+    for index in range(sections):
+        parts.append(
+            f"## Section {index}\n\n"
+            f"Some **bold**, *italic* and ~~struck~~ text with a footnote[^{index}] "
+            f"and a [link](https://example.com/{index}).\n\n"
+            "- [x] done item\n- [ ] open item\n\n"
+            "| Column | Value |\n|--------|-------|\n| a | 1 |\n| b | 2 |\n\n"
+            f"```python\ndef section_{index}():\n    return {index}\n```\n\n"
+            f"> A quote in section {index}.\n\n"
+            f"[^{index}]: Footnote {index}.\n"
+        )
+    return "\n".join(parts)
+
+
+def render_to_string(text):
+    return str(render_markdown(text))
+
+
+def run(executor_class, render, text, renders, workers):
+    """
+    Renders text renders times spread over workers and returns the elapsed
+    seconds and the set of distinct outputs.
+    """
+    with executor_class(max_workers=workers) as executor:
+        # Start every worker and let it build its renderer before timing.
+        list(executor.map(render, [text] * workers))
+        start = perf_counter()
+        outputs = set(executor.map(render, [text] * renders))
+        elapsed = perf_counter() - start
+    return elapsed, outputs
+
+
+def benchmark():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--renders", type=int, default=400)
+    parser.add_argument("--threads", default="1,2,4,8")
+    args = parser.parse_args()
+
+    thread_counts = [int(count) for count in args.threads.split(",")]
+    text = sample_post()
+    expected = str(SafeMarkdownRenderer().render(text))
+
+    shared_renderer = SafeMarkdownRenderer()
+    shared_lock = Lock()
+
+    def render_shared(text):
+        with shared_lock:
+            return str(shared_renderer.render(text))
+
+    print("=" * 60)
+    print("FlaskBlog Markdown Renderer Benchmark")
+    print(f"{len(text)} characters, {args.renders} renders per run")
+    print("=" * 60)
+    print(
+        f"\n{'workers':>8} {'per-thread/s':>14} {'shared+lock/s':>14} "
+        f"{'processes/s':>12}"
+    )
+
+    for workers in thread_counts:
+        rates = []
+
+        for executor_class, render in (
+            (ThreadPoolExecutor, render_to_string),
+            (ThreadPoolExecutor, render_shared),
+            (ProcessPoolExecutor, render_to_string),
+        ):
+            elapsed, outputs = run(executor_class, render, text, args.renders, workers)
+
+            if outputs != {expected}:
+                print(f"\nRendered output differs at {workers} workers")
+                sys.exit(1)
+
+            rates.append(args.renders / elapsed)
+
+        print(f"{workers:>8} {rates[0]:>14.1f} {rates[1]:>14.1f} {rates[2]:>12.1f}")
+
+    print("\n" + "=" * 60)
+    print("Benchmark Complete!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Builds the indexes declared in models.py on an existing database.
+
+db.create_all() only creates indexes together with their tables, so databases
+created before an index was added to models.py never get it. This script
+creates every missing index one at a time, each in its own short transaction,
+so the app can keep serving requests while it runs. Indexes on columns that
+a migration script has not added to the table yet are skipped and reported.
+Indexes that earlier versions declared and no query uses anymore are dropped.
+
+Usage:
+    cd /path/to/flaskBlog/app
+    python scripts/create_indexes.py
+"""
+
+import os
+import sys
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from sqlalchemy import Column, exc, inspect, text
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.sql.visitors import iterate
+
+from settings import Settings
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Replaced by the coalesce(time_stamp, 0) and lower(category) indexes.
+OBSOLETE_INDEX_NAMES = (
+    "ix_posts_time_stamp",
+    "ix_posts_category",
+    "ix_posts_author_time_stamp",
+    "ix_comments_time_stamp",
+)
+
+
+def get_existing_index_names(engine):
+    if engine.url.get_backend_name() == "sqlite":
+        with engine.connect() as connection:
+            rows = connection.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'index'")
+            )
+            return {row[0] for row in rows}
+
+    inspector = inspect(engine)
+    names = set()
+
+    # Expression indexes can't be reflected on every backend, those are
+    # skipped here and covered by IF NOT EXISTS below.
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", exc.SAWarning)
+        for table_name in inspector.get_table_names():
+            names.update(index["name"] for index in inspector.get_indexes(table_name))
+
+    return names
+
+
+def get_index_column_names(index):
+    return {
+        element.name
+        for expression in index.expressions
+        for element in iterate(expression)
+        if isinstance(element, Column)
+    }
+
+
+def create_indexes():
+    print("=" * 60)
+    print("FlaskBlog Index Builder")
+    print("=" * 60)
+
+    app = Flask(__name__, root_path=APP_DIR)
+    app.config["SQLALCHEMY_DATABASE_URI"] = Settings.SQLALCHEMY_DATABASE_URI
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+
+    import models  # noqa: F401
+    from database import db
+
+    db.init_app(app)
+
+    with app.app_context():
+        db.create_all()
+
+        backend = db.engine.url.get_backend_name()
+        existing = get_existing_index_names(db.engine)
+        inspector = inspect(db.engine)
+        created = 0
+        skipped = 0
+        dropped = 0
+
+        for index_name in OBSOLETE_INDEX_NAMES:
+            if index_name not in existing:
+                continue
+
+            with db.engine.connect() as connection:
+                connection.execution_options(isolation_level="AUTOCOMMIT").execute(
+                    text(f"DROP INDEX IF EXISTS {index_name}")
+                )
+
+            print(f"   Dropped: {index_name}")
+            dropped += 1
+
+        for table in db.metadata.sorted_tables:
+            table_columns = {
+                column["name"] for column in inspector.get_columns(table.name)
+            }
+
+            for index in sorted(table.indexes, key=lambda index: index.name):
+                if index.name in existing:
+                    print(f"   Exists: {index.name}")
+                    continue
+
+                missing_columns = get_index_column_names(index) - table_columns
+                if missing_columns:
+                    print(
+                        f"   Skipped: {index.name}, {table.name} has no "
+                        f"{', '.join(sorted(missing_columns))} column yet"
+                    )
+                    skipped += 1
+                    continue
+
+                if backend == "postgresql":
+                    index.dialect_options["postgresql"]["concurrently"] = True
+
+                with db.engine.connect() as connection:
+                    connection = connection.execution_options(
+                        isolation_level="AUTOCOMMIT"
+                    )
+                    connection.execute(CreateIndex(index, if_not_exists=True))
+
+                print(f"   Created: {index.name}")
+                created += 1
+
+        if created and backend in ("sqlite", "postgresql"):
+            print("\nUpdating query planner statistics...")
+            with db.engine.connect() as connection:
+                connection.execution_options(isolation_level="AUTOCOMMIT").execute(
+                    text("ANALYZE")
+                )
+
+    print("\n" + "=" * 60)
+    print(f"Done! Created {created} index(es), dropped {dropped} index(es)")
+    if skipped:
+        print(
+            f"Skipped {skipped} index(es) on missing columns, run the migration "
+            "scripts that add them and then this script again"
+        )
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    create_indexes()
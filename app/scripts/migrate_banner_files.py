@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Migration script that moves post banners out of the database into files.
+
+Banners and their variants are served from content addressed files under
+BANNER_STORAGE_ROOT instead of BLOB columns. This script writes every stored
+banner and variant to its file, then drops post_banners.image and
+banner_variants.image. Banners without variants get a copy with their
+metadata stripped, so they are served before the app's banner worker has
+made their variants.
+
+Usage:
+    cd /path/to/flaskBlog/app
+    python scripts/migrate_banner_files.py
+"""
+
+import os
+import shutil
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from sqlalchemy import inspect, text
+
+from settings import Settings
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def create_backup(database_path):
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    backup_path = f"{database_path}.backup_{timestamp}"
+    shutil.copy2(database_path, backup_path)
+    return backup_path
+
+
+def migrate_banner_files():
+    print("=" * 60)
+    print("FlaskBlog Database Migration")
+    print("post_banners.image, banner_variants.image -> files")
+    print("=" * 60)
+
+    app = Flask(__name__, root_path=APP_DIR)
+    app.config["SQLALCHEMY_DATABASE_URI"] = Settings.SQLALCHEMY_DATABASE_URI
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+
+    from database import db
+    from utils.banner_processor import process_fallback_banner
+    from utils.banner_storage import (
+        banner_file_name,
+        banner_storage_root,
+        write_banner_file,
+    )
+    from utils.post_banner import hash_banner, sniff_mimetype
+
+    db.init_app(app)
+
+    with app.app_context():
+        inspector = inspect(db.engine)
+        table_names = inspector.get_table_names()
+
+        if "post_banners" not in table_names:
+            print("\nNo post_banners table found. Run migrate_post_banners.py first.")
+            return
+
+        tables = [
+            table
+            for table in ("post_banners", "banner_variants")
+            if table in table_names
+            and "image" in [column["name"] for column in inspector.get_columns(table)]
+        ]
+
+        if not tables:
+            print("\nBanners are already stored as files. Nothing to migrate.")
+            return
+
+        is_sqlite = db.engine.url.get_backend_name() == "sqlite"
+
+        if is_sqlite:
+            print("\n1. Creating backup...")
+            backup_path = create_backup(db.engine.url.database)
+            print(f"   Backup: {backup_path}")
+        else:
+            print("\n1. Skipping backup, back up your database before continuing")
+
+        print(f"\n2. Writing banner files to {banner_storage_root()}...")
+        written = 0
+
+        if "post_banners" in tables:
+            post_ids = db.session.scalars(
+                text("SELECT post_id FROM post_banners WHERE image IS NOT NULL")
+            ).all()
+
+            for post_id in post_ids:
+                image = db.session.scalar(
+                    text("SELECT image FROM post_banners WHERE post_id = :post_id"),
+                    {"post_id": post_id},
+                )
+                banner_hash = hash_banner(image)
+                written += write_banner_file(banner_file_name(banner_hash), image)
+                db.session.execute(
+                    text(
+                        "UPDATE post_banners SET hash = :hash, mimetype = :mimetype "
+                        "WHERE post_id = :post_id"
+                    ),
+                    {
+                        "hash": banner_hash,
+                        "mimetype": sniff_mimetype(image),
+                        "post_id": post_id,
+                    },
+                )
+                db.session.commit()
+
+        if "banner_variants" in tables:
+            keys = db.session.execute(
+                text("SELECT source_hash, variant, format FROM banner_variants")
+            ).all()
+
+            for source_hash, variant, image_format in keys:
+                image = db.session.scalar(
+                    text(
+                        "SELECT image FROM banner_variants WHERE source_hash = :hash "
+                        "AND variant = :variant AND format = :format"
+                    ),
+                    {"hash": source_hash, "variant": variant, "format": image_format},
+                )
+                written += write_banner_file(
+                    banner_file_name(source_hash, variant, image_format), image
+                )
+
+        print(f"   Written: {written}")
+
+        print("\n3. Dropping image columns...")
+        for table in tables:
+            db.session.execute(text(f"ALTER TABLE {table} DROP COLUMN image"))
+            print(f"   Dropped {table}.image")
+        db.session.commit()
+
+        print("\n4. Stripping metadata of banners without variants...")
+        banner_hashes = db.session.scalars(
+            text("SELECT DISTINCT hash FROM post_banners WHERE hash IS NOT NULL")
+        ).all()
+        stripped = sum(
+            process_fallback_banner(banner_hash) for banner_hash in banner_hashes
+        )
+        print(f"   Stripped: {stripped}")
+
+        if is_sqlite:
+            print("\n5. Reclaiming free space...")
+            with db.engine.connect() as connection:
+                connection.execution_options(isolation_level="AUTOCOMMIT").execute(
+                    text("VACUUM")
+                )
+
+    print("\n" + "=" * 60)
+    print("Migration Complete!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    migrate_banner_files()
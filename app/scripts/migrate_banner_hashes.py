@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Migration script that adds content hashes and mimetypes to post banners.
+
+Banner URLs include the SHA-256 hash of the banner so browsers can cache them
+for good, and banners are served with the mimetype sniffed from their bytes.
+This script adds post_banners.hash and post_banners.mimetype to an existing
+database and fills them in for every stored banner.
+
+Usage:
+    cd /path/to/flaskBlog/app
+    python scripts/migrate_banner_hashes.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from sqlalchemy import inspect, text
+
+from settings import Settings
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def migrate_banner_hashes():
+    print("=" * 60)
+    print("FlaskBlog Database Migration")
+    print("post_banners.hash, post_banners.mimetype")
+    print("=" * 60)
+
+    app = Flask(__name__, root_path=APP_DIR)
+    app.config["SQLALCHEMY_DATABASE_URI"] = Settings.SQLALCHEMY_DATABASE_URI
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+
+    from database import db
+    from utils.post_banner import hash_banner, sniff_mimetype
+
+    db.init_app(app)
+
+    with app.app_context():
+        inspector = inspect(db.engine)
+
+        if "post_banners" not in inspector.get_table_names():
+            print("\nNo post_banners table found. Run migrate_post_banners.py first.")
+            return
+
+        banner_columns = [
+            column["name"] for column in inspector.get_columns("post_banners")
+        ]
+
+        print("\n1. Adding banner columns...")
+        for column, column_type in (
+            ("hash", "VARCHAR(64)"),
+            ("mimetype", "VARCHAR(32)"),
+        ):
+            if column in banner_columns:
+                print(f"   post_banners.{column} already exists")
+            else:
+                db.session.execute(
+                    text(f"ALTER TABLE post_banners ADD COLUMN {column} {column_type}")
+                )
+                print(f"   Added post_banners.{column}")
+        db.session.commit()
+
+        print("\n2. Hashing banners...")
+        post_ids = db.session.scalars(
+            text("SELECT post_id FROM post_banners WHERE hash IS NULL")
+        ).all()
+
+        for post_id in post_ids:
+            image = db.session.scalar(
+                text("SELECT image FROM post_banners WHERE post_id = :post_id"),
+                {"post_id": post_id},
+            )
+            db.session.execute(
+                text(
+                    "UPDATE post_banners SET hash = :hash, mimetype = :mimetype "
+                    "WHERE post_id = :post_id"
+                ),
+                {
+                    "hash": hash_banner(image),
+                    "mimetype": sniff_mimetype(image),
+                    "post_id": post_id,
+                },
+            )
+            db.session.commit()
+
+        print(f"   Hashed {len(post_ids)} banners")
+
+    print("\n" + "=" * 60)
+    print("Migration Complete!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    migrate_banner_hashes()
@@ -135,7 +135,8 @@ def migrate_data():
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 
     from database import db
-    from models import Comment, Post, User
+    from models import Comment, Post, PostBanner, User
+    from utils.post_banner import sniff_mimetype, store_banner
 
     db.init_app(app)
 
@@ -205,7 +206,12 @@ def migrate_data():
                 title=title,
                 tags=tags,
                 content=content,
-                banner=banner if banner else b"",
+                banner=PostBanner(
+                    hash=store_banner(banner),
+                    mimetype=sniff_mimetype(banner),
+                )
+                if banner
+                else None,
                 author=author,
                 views=views or 0,
                 time_stamp=time_stamp,
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Migration script that adds the stored hot score column to the posts table.
+
+The home page sorts posts by a hot score that used to be computed for every
+row on every request. It is now stored in posts.hot_score, indexed, and kept
+fresh by a background job. This script adds the column and its index to an
+existing database and fills in the initial scores.
+
+Usage:
+    cd /path/to/flaskBlog/app
+    python scripts/migrate_hot_score.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from sqlalchemy import inspect, text
+
+from settings import Settings
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def migrate_hot_score():
+    print("=" * 60)
+    print("FlaskBlog Database Migration")
+    print("posts.hot_score")
+    print("=" * 60)
+
+    app = Flask(__name__, root_path=APP_DIR)
+    app.config["SQLALCHEMY_DATABASE_URI"] = Settings.SQLALCHEMY_DATABASE_URI
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+
+    from database import db
+    from models import Post
+    from utils.hot_score import refresh_hot_scores
+
+    db.init_app(app)
+
+    with app.app_context():
+        inspector = inspect(db.engine)
+
+        if "posts" not in inspector.get_table_names():
+            print("\nNo posts table found. Nothing to migrate.")
+            return
+
+        post_columns = [column["name"] for column in inspector.get_columns("posts")]
+
+        if "hot_score" in post_columns:
+            print("\n1. posts.hot_score already exists")
+        else:
+            print("\n1. Adding posts.hot_score column...")
+            db.session.execute(
+                text("ALTER TABLE posts ADD COLUMN hot_score FLOAT NOT NULL DEFAULT 0")
+            )
+            db.session.commit()
+
+        print("\n2. Creating hot score index...")
+        for index in Post.__table__.indexes:
+            if index.name == "ix_posts_hot_score":
+                index.create(db.engine, checkfirst=True)
+
+        print("\n3. Computing hot scores...")
+        refresh_hot_scores()
+
+    print("\n" + "=" * 60)
+    print("Migration Complete!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    migrate_hot_score()
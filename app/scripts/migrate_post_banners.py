@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Migration script that moves post banners out of the posts table.
+
+Older databases store every banner as a BLOB column on the posts table, which
+means every post listing reads all banner images into memory. This script
+copies the banners into the post_banners table and drops the old column.
+
+Usage:
+    cd /path/to/flaskBlog/app
+    python scripts/migrate_post_banners.py
+"""
+
+import os
+import shutil
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from sqlalchemy import inspect, text
+
+from settings import Settings
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def create_backup(database_path):
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    backup_path = f"{database_path}.backup_{timestamp}"
+    shutil.copy2(database_path, backup_path)
+    return backup_path
+
+
+def migrate_post_banners():
+    print("=" * 60)
+    print("FlaskBlog Database Migration")
+    print("posts.banner -> post_banners")
+    print("=" * 60)
+
+    app = Flask(__name__, root_path=APP_DIR)
+    app.config["SQLALCHEMY_DATABASE_URI"] = Settings.SQLALCHEMY_DATABASE_URI
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+
+    from database import db
+
+    db.init_app(app)
+
+    with app.app_context():
+        inspector = inspect(db.engine)
+
+        if "posts" not in inspector.get_table_names():
+            print("\nNo posts table found. Nothing to migrate.")
+            return
+
+        post_columns = [column["name"] for column in inspector.get_columns("posts")]
+
+        if "banner" not in post_columns:
+            print("\nBanners are already stored in post_banners. Nothing to migrate.")
+            return
+
+        is_sqlite = db.engine.url.get_backend_name() == "sqlite"
+
+        if is_sqlite:
+            print("\n1. Creating backup...")
+            backup_path = create_backup(db.engine.url.database)
+            print(f"   Backup: {backup_path}")
+        else:
+            print("\n1. Skipping backup, back up your database before continuing")
+
+        print("\n2. Creating post_banners table...")
+        # The image column is moved to files by migrate_banner_files.py.
+        db.session.execute(
+            text(
+                "CREATE TABLE IF NOT EXISTS post_banners ("
+                "post_id INTEGER NOT NULL PRIMARY KEY "
+                "REFERENCES posts (id) ON DELETE CASCADE, "
+                "image BLOB NOT NULL)"
+            )
+        )
+        db.session.commit()
+
+        print("\n3. Copying banners...")
+        result = db.session.execute(
+            text(
+                "INSERT INTO post_banners (post_id, image) "
+                "SELECT id, banner FROM posts "
+                "WHERE banner IS NOT NULL AND length(banner) > 0 "
+                "AND id NOT IN (SELECT post_id FROM post_banners)"
+            )
+        )
+        db.session.commit()
+        print(f"   Copied: {result.rowcount}")
+
+        print("\n4. Dropping posts.banner column...")
+        db.session.execute(text("ALTER TABLE posts DROP COLUMN banner"))
+        db.session.commit()
+
+        if is_sqlite:
+            print("\n5. Reclaiming free space...")
+            with db.engine.connect() as connection:
+                connection.execution_options(isolation_level="AUTOCOMMIT").execute(
+                    text("VACUUM")
+                )
+
+    print("\n" + "=" * 60)
+    print("Migration Complete!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    migrate_post_banners()
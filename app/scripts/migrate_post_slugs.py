@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Migration script that adds the stored slug and reading time columns to the
+posts table.
+
+Post links and post pages used to compute the slug from the title and the
+reading time from the content on every request. Both are now stored in
+posts.slug and posts.reading_time when a post is created or edited. This
+script adds the columns to an existing database and fills them in for every
+post.
+
+Usage:
+    cd /path/to/flaskBlog/app
+    python scripts/migrate_post_slugs.py [--batch-size 500]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+
+from flask import Flask
+from sqlalchemy import bindparam, inspect, or_, select, text, update
+
+from settings import Settings
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def migrate_post_slugs():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("FlaskBlog Database Migration")
+    print("posts.slug, posts.reading_time")
+    print("=" * 60)
+
+    app = Flask(__name__, root_path=APP_DIR)
+    app.config["SQLALCHEMY_DATABASE_URI"] = Settings.SQLALCHEMY_DATABASE_URI
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+
+    from database import db
+    from models import Post
+    from utils.calculate_read_time import calculate_read_time
+    from utils.generate_url_id_from_post import get_slug_from_post_title
+
+    db.init_app(app)
+
+    with app.app_context():
+        inspector = inspect(db.engine)
+
+        if "posts" not in inspector.get_table_names():
+            print("\nNo posts table found. Nothing to migrate.")
+            return
+
+        post_columns = [column["name"] for column in inspector.get_columns("posts")]
+
+        print("\n1. Adding post columns...")
+        for column, column_type in (("slug", "TEXT"), ("reading_time", "INTEGER")):
+            if column in post_columns:
+                print(f"   posts.{column} already exists")
+            else:
+                db.session.execute(
+                    text(f"ALTER TABLE posts ADD COLUMN {column} {column_type}")
+                )
+                print(f"   Added posts.{column}")
+        db.session.commit()
+
+        print("\n2. Filling in slugs and reading times...")
+        table = Post.__table__
+        missing = or_(table.c.slug.is_(None), table.c.reading_time.is_(None))
+        last_id = 0
+        filled = 0
+
+        while True:
+            rows = db.session.execute(
+                select(table.c.id, table.c.title, table.c.content)
+                .where(missing, table.c.id > last_id)
+                .order_by(table.c.id)
+                .limit(args.batch_size)
+            ).all()
+
+            if not rows:
+                break
+
+            db.session.execute(
+                update(table)
+                .where(table.c.id == bindparam("post_id"))
+                .values(
+                    slug=bindparam("post_slug"),
+                    reading_time=bindparam("post_reading_time"),
+                ),
+                [
+                    {
+                        "post_id": post_id,
+                        "post_slug": get_slug_from_post_title(title),
+                        "post_reading_time": calculate_read_time(content),
+                    }
+                    for post_id, title, content in rows
+                ],
+            )
+            db.session.commit()
+
+            last_id = rows[-1].id
+            filled += len(rows)
+
+        print(f"   Filled in {filled} posts")
+
+    print("\n" + "=" * 60)
+    print("Migration Complete!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    migrate_post_slugs()
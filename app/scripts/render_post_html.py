@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Backfill script that renders and stores the HTML of post content.
+
+Post pages serve HTML rendered once at create and edit time and stored in
+posts.content_html, tagged with the renderer version in
+posts.content_html_version. This script adds those columns to an existing
+database and re-renders every post whose HTML is missing or was rendered by
+another version, e.g. after RENDERER_VERSION in utils/markdown_renderer.py is
+bumped.
+
+Usage:
+    cd /path/to/flaskBlog/app
+    python scripts/render_post_html.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from sqlalchemy import inspect, text
+
+from settings import Settings
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def render_post_html():
+    print("=" * 60)
+    print("FlaskBlog Database Backfill")
+    print("posts.content_html")
+    print("=" * 60)
+
+    app = Flask(__name__, root_path=APP_DIR)
+    app.config["SQLALCHEMY_DATABASE_URI"] = Settings.SQLALCHEMY_DATABASE_URI
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+
+    from database import db
+    from utils.markdown_renderer import RENDERER_VERSION
+    from utils.post_html import rerender_stale_posts
+
+    db.init_app(app)
+
+    with app.app_context():
+        inspector = inspect(db.engine)
+
+        if "posts" not in inspector.get_table_names():
+            print("\nNo posts table found. Nothing to render.")
+            return
+
+        post_columns = [column["name"] for column in inspector.get_columns("posts")]
+
+        print("\n1. Adding stored HTML columns...")
+        for column, column_type in (
+            ("content_html", "TEXT"),
+            ("content_html_version", "INTEGER"),
+        ):
+            if column in post_columns:
+                print(f"   posts.{column} already exists")
+            else:
+                db.session.execute(
+                    text(f"ALTER TABLE posts ADD COLUMN {column} {column_type}")
+                )
+                print(f"   Added posts.{column}")
+        db.session.commit()
+
+        print(f"\n2. Rendering stale posts with renderer version {RENDERER_VERSION}...")
+        rendered = rerender_stale_posts()
+        print(f"   Rendered {rendered} posts")
+
+    print("\n" + "=" * 60)
+    print("Backfill Complete!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    render_post_html()
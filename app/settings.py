@@ -29,19 +29,42 @@ class Settings:
         LOG_IN (bool): Toggle user login feature.
         REGISTRATION (bool): Toggle user registration feature.
         LANGUAGES (list): Supported languages for the application.
+        TRANSLATIONS_RELOAD_ON_SIGHUP (bool): Toggle reloading translation files on SIGHUP.
         TAMGA_LOGGER (bool): Toggle custom logging feature.
         WERKZEUG_LOGGER (bool): Toggle werkzeug logging feature.
         LOG_TO_FILE (bool): Toggle logging to file feature.
         LOG_TO_JSON (bool): Toggle logging to JSON feature.
         LOG_FOLDER_ROOT (str): Root path of the log folder.
         LOG_FILE_ROOT (str): Root path of the log file.
-        LOG_JSON_ROOT (str): Root path of the log JSON file.
+        LOG_JSON_ROOT (str): Root path of the log JSON lines (NDJSON) file.
+        LOG_QUEUE_SIZE (int): Maximum number of log records waiting for the writer thread, 0 writes them synchronously.
+        LOG_BATCH_SIZE (int): Maximum number of log records written between flushes.
+        LOG_LEVEL (str): Lowest level that is logged (TRACE, DEBUG, INFO, SUCCESS, WARNING, ERROR, CRITICAL).
+        LOG_MODULE_LEVELS (str): Per-module levels as "module=LEVEL,module=LEVEL", a module also covers its submodules.
+        LOG_INFO_SAMPLE_RATE (float): Fraction of INFO records that are logged, between 0 and 1.
+        LOG_ROTATE_MAX_MB (int): Size in MB after which a log file is rotated, 0 disables size rotation.
+        LOG_ROTATE_INTERVAL (int): Seconds per log file segment, 0 disables time rotation.
+        LOG_ROTATE_COMPRESS (bool): Toggle gzipping rotated log files.
+        LOG_ROTATE_BACKUPS (int): Number of rotated segments kept per log file, 0 keeps all of them.
         APP_SECRET_KEY (str): Secret key for Flask sessions.
         SESSION_PERMANENT (bool): Toggle permanent sessions for the Flask application.
         DB_FOLDER_ROOT (str): Root path of the database folder.
         DB_USERS_ROOT (str): Root path of the users database.
         DB_POSTS_ROOT (str): Root path of the posts database.
         DB_COMMENTS_ROOT (str): Root path of the comments database.
+        HOT_SCORE_REFRESH_INTERVAL (int): Seconds between hot score recomputes.
+        COUNT_CACHE_TTL (int): Seconds a cached pagination row count stays valid.
+        VIEW_COUNT_FLUSH_INTERVAL (int): Seconds between buffered post view writes.
+        PAGE_CACHE_TTL (int): Seconds a cached page is served to logged out visitors, 0 disables the cache.
+        PAGE_CACHE_MAX_ENTRIES (int): Maximum number of cached pages per process.
+        BANNER_STORAGE_ROOT (str): Root path of the banner image files.
+        BANNER_SENDFILE (str): Empty to send banner files from the app, or X-Sendfile / X-Accel-Redirect to let the proxy send them.
+        BANNER_ACCEL_REDIRECT_PREFIX (str): Internal proxy location that maps to BANNER_STORAGE_ROOT, used with X-Accel-Redirect.
+        BANNER_PRUNE_INTERVAL (int): Seconds between deletions of unused banner files and variants.
+        METRICS (bool): Toggle the metrics registry and the /metrics endpoint.
+        METRICS_ALLOWED_ADDRESSES (str): Comma separated client addresses allowed to read /metrics without an admin login, empty for admins only.
+        METRICS_DIR (str): Root path of the per process metrics snapshots, shared by the workers of one host.
+        METRICS_FLUSH_INTERVAL (int): Seconds between metrics snapshot writes.
 
         SMTP_SERVER (str): SMTP server address.
         SMTP_PORT (int): SMTP server port.
@@ -71,6 +94,9 @@ class Settings:
     LANGUAGES = os.environ.get(
         "LANGUAGES", "en,tr,es,de,zh,fr,uk,ru,pt,ja,pl,hi"
     ).split(",")
+    TRANSLATIONS_RELOAD_ON_SIGHUP = _bool(
+        os.environ.get("TRANSLATIONS_RELOAD_ON_SIGHUP", "False")
+    )
 
     # Theme Configuration
     THEMES = [
@@ -118,7 +144,16 @@ class Settings:
     LOG_TO_JSON = _bool(os.environ.get("LOG_TO_JSON", "True"))
     LOG_FOLDER_ROOT = os.environ.get("LOG_FOLDER_ROOT", "log/")
     LOG_FILE_ROOT = LOG_FOLDER_ROOT + "log.log"
-    LOG_JSON_ROOT = LOG_FOLDER_ROOT + "log.json"
+    LOG_JSON_ROOT = LOG_FOLDER_ROOT + "log.jsonl"
+    LOG_QUEUE_SIZE = int(os.environ.get("LOG_QUEUE_SIZE", 10000))
+    LOG_BATCH_SIZE = int(os.environ.get("LOG_BATCH_SIZE", 500))
+    LOG_LEVEL = os.environ.get("LOG_LEVEL", "TRACE")
+    LOG_MODULE_LEVELS = os.environ.get("LOG_MODULE_LEVELS", "")
+    LOG_INFO_SAMPLE_RATE = float(os.environ.get("LOG_INFO_SAMPLE_RATE", 1.0))
+    LOG_ROTATE_MAX_MB = int(os.environ.get("LOG_ROTATE_MAX_MB", 50))
+    LOG_ROTATE_INTERVAL = int(os.environ.get("LOG_ROTATE_INTERVAL", 86400))
+    LOG_ROTATE_COMPRESS = _bool(os.environ.get("LOG_ROTATE_COMPRESS", "True"))
+    LOG_ROTATE_BACKUPS = int(os.environ.get("LOG_ROTATE_BACKUPS", 14))
     # Session Configuration
     APP_SECRET_KEY = os.environ.get("APP_SECRET_KEY", secrets.token_urlsafe(32))
     SESSION_PERMANENT = _bool(os.environ.get("SESSION_PERMANENT", "True"))
@@ -131,6 +166,33 @@ class Settings:
         os.environ.get("SQLALCHEMY_TRACK_MODIFICATIONS", "False")
     )
 
+    # Hot Score Configuration
+    HOT_SCORE_REFRESH_INTERVAL = int(os.environ.get("HOT_SCORE_REFRESH_INTERVAL", 300))
+
+    # View Count Configuration
+    VIEW_COUNT_FLUSH_INTERVAL = int(os.environ.get("VIEW_COUNT_FLUSH_INTERVAL", 10))
+
+    # Pagination Configuration
+    COUNT_CACHE_TTL = int(os.environ.get("COUNT_CACHE_TTL", 60))
+
+    # Page Cache Configuration
+    PAGE_CACHE_TTL = int(os.environ.get("PAGE_CACHE_TTL", 60))
+    PAGE_CACHE_MAX_ENTRIES = int(os.environ.get("PAGE_CACHE_MAX_ENTRIES", 512))
+
+    # Banner Storage Configuration
+    BANNER_STORAGE_ROOT = os.environ.get("BANNER_STORAGE_ROOT", "instance/banners/")
+    BANNER_SENDFILE = os.environ.get("BANNER_SENDFILE", "")
+    BANNER_ACCEL_REDIRECT_PREFIX = os.environ.get(
+        "BANNER_ACCEL_REDIRECT_PREFIX", "/banner-files/"
+    )
+    BANNER_PRUNE_INTERVAL = int(os.environ.get("BANNER_PRUNE_INTERVAL", 3600))
+
+    # Metrics Configuration
+    METRICS = _bool(os.environ.get("METRICS", "True"))
+    METRICS_ALLOWED_ADDRESSES = os.environ.get("METRICS_ALLOWED_ADDRESSES", "")
+    METRICS_DIR = os.environ.get("METRICS_DIR", "instance/metrics/")
+    METRICS_FLUSH_INTERVAL = int(os.environ.get("METRICS_FLUSH_INTERVAL", 5))
+
     # SMTP Mail Configuration
     SMTP_SERVER = os.environ.get("SMTP_SERVER", "smtp.gmail.com")
     SMTP_PORT = int(os.environ.get("SMTP_PORT", 587))
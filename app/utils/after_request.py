@@ -1,11 +1,17 @@
 from flask import request
+
 from utils.log import Log
+from utils.request_timer import request_timings
 
 
 def after_request_logger(response):
     """
     This function is used to log the response of an HTTP request.
 
+    The record carries the request and its timings as structured fields, so
+    the JSON log can be grouped by blueprint or endpoint and the latency
+    percentiles computed from it.
+
     Parameters:
         response (Response): The response object returned by the HTTP request.
 
@@ -13,17 +19,31 @@ def after_request_logger(response):
         Response: The response object returned by the HTTP request.
     """
 
-    if response.status == "200 OK":
-        Log.success(
-            f"Adress: {request.remote_addr} | Method: {request.method} | Path: {request.path} | Scheme: {request.scheme} | Status: {response.status} | Content Length: {response.content_length} | Referrer: {request.referrer} | User Agent: {request.user_agent}",
-        )
-    elif response.status == "404 NOT FOUND":
-        Log.error(
-            f"Adress: {request.remote_addr} | Method: {request.method} | Path: {request.path} | Scheme: {request.scheme} | Status: {response.status} | Content Length: {response.content_length} | Referrer: {request.referrer} | User Agent: {request.user_agent}",
-        )
+    status_code = response.status_code
+
+    if status_code >= 400:
+        log = Log.error
+    elif 200 <= status_code < 300:
+        log = Log.success
     else:
-        Log.info(
-            f"Adress: {request.remote_addr} | Method: {request.method} | Path: {request.path} | Scheme: {request.scheme} | Status: {response.status} | Content Length: {response.content_length} | Referrer: {request.referrer} | User Agent: {request.user_agent}",
-        )
+        log = Log.info
+
+    log(
+        "%s %s %s",
+        request.method,
+        request.path,
+        status_code,
+        method=request.method,
+        path=request.path,
+        endpoint=request.endpoint,
+        blueprint=request.blueprint,
+        status=status_code,
+        bytes=response.content_length,
+        **request_timings(),
+        address=request.remote_addr,
+        scheme=request.scheme,
+        referrer=request.referrer,
+        user_agent=request.user_agent.string,
+    )
 
     return response
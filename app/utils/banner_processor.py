@@ -0,0 +1,346 @@
+"""
+This module contains the background processing of post banner images.
+
+Uploaded banners are stored as they were uploaded. A worker thread turns
+each distinct banner, by content hash, into a card, a hero and an original
+size variant, each encoded as AVIF (when Pillow supports it), WebP and a
+JPEG or PNG fallback. Re-encoding drops EXIF and every other metadata block
+after the EXIF orientation has been applied to the pixels.
+
+The upload itself is never sent, it may carry metadata. When a banner is
+uploaded, a full size copy with its metadata stripped is saved right away,
+without optimizing the encoding, and sent in place of the variants the
+worker has not made yet.
+
+Variants are stored as files next to the upload they were made from, see
+utils/banner_storage.py, so posts sharing a banner share its variants. The
+files and variants of uploads no longer used by any post are pruned every
+BANNER_PRUNE_INTERVAL seconds.
+"""
+
+from io import BytesIO
+from queue import Empty, Queue
+from threading import Thread
+from time import monotonic
+
+from PIL import Image, ImageOps, features
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+
+from database import db
+from models import BannerVariant, PostBanner
+from settings import Settings
+from utils.banner_storage import (
+    banner_file_name,
+    prune_banner_files,
+    read_banner_file,
+    write_banner_file,
+)
+from utils.log import Log
+
+# Largest width of each variant, None keeps the uploaded width. Images are
+# never upscaled.
+VARIANT_WIDTHS = {"card": 640, "hero": 1600, "original": None}
+
+# Formats offered to browsers through <picture>, in order of preference.
+MODERN_FORMATS = ("avif", "webp") if features.check("avif") else ("webp",)
+
+# Formats the fallback <img> is encoded in, PNG keeps transparency.
+FALLBACK_FORMATS = ("jpeg", "png")
+
+ENCODER_OPTIONS = {
+    "avif": {"quality": 60},
+    "webp": {"quality": 80, "method": 4},
+    "jpeg": {"quality": 85, "optimize": True, "progressive": True},
+    "png": {"optimize": True},
+}
+
+# The metadata stripped copy of an upload, sent until the worker has made
+# the variants. It is encoded quickly, on the request thread.
+STRIPPED_VARIANT = "stripped"
+STRIPPED_ENCODER_OPTIONS = {"jpeg": {"quality": 90}, "png": {"compress_level": 1}}
+
+_queue = Queue()
+
+
+def _encode(image, image_format):
+    output = BytesIO()
+    image.save(output, format=image_format.upper(), **ENCODER_OPTIONS[image_format])
+    return output.getvalue()
+
+
+def _open_upload(image_bytes):
+    with Image.open(BytesIO(image_bytes)) as uploaded:
+        image = ImageOps.exif_transpose(uploaded)
+        has_alpha = image.mode in ("RGBA", "LA", "PA") or (
+            image.mode == "P" and "transparency" in image.info
+        )
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
+    return image, "png" if has_alpha else "jpeg"
+
+
+def make_banner_variants(image_bytes):
+    """
+    Returns the variants of an uploaded banner image.
+
+    Parameters:
+        image_bytes (bytes): The uploaded image.
+
+    Returns:
+        list: (variant, format, width, mimetype, image bytes) tuples.
+    """
+    image, fallback_format = _open_upload(image_bytes)
+    variants = []
+
+    for variant, max_width in VARIANT_WIDTHS.items():
+        if max_width is not None and image.width > max_width:
+            height = max(1, round(image.height * max_width / image.width))
+            resized = image.resize((max_width, height), Image.Resampling.LANCZOS)
+        else:
+            resized = image
+
+        for image_format in (*MODERN_FORMATS, fallback_format):
+            variants.append(
+                (
+                    variant,
+                    image_format,
+                    resized.width,
+                    f"image/{image_format}",
+                    _encode(resized, image_format),
+                )
+            )
+
+    return variants
+
+
+def process_banner(source_hash):
+    """
+    Creates and stores the missing variants of the banner with the given hash.
+
+    Parameters:
+        source_hash (str): The content hash of the uploaded banner.
+
+    Returns:
+        int: The number of variants stored.
+    """
+    existing = set(
+        db.session.execute(
+            select(BannerVariant.variant, BannerVariant.format).where(
+                BannerVariant.source_hash == source_hash
+            )
+        ).all()
+    )
+    image_bytes = read_banner_file(banner_file_name(source_hash))
+
+    if image_bytes is None:
+        Log.warning(f"Banner: {source_hash} | File is missing, no variants made")
+        return 0
+
+    variants = []
+
+    for variant, image_format, width, mimetype, image in make_banner_variants(
+        image_bytes
+    ):
+        if (variant, image_format) in existing:
+            continue
+
+        write_banner_file(banner_file_name(source_hash, variant, image_format), image)
+        variants.append(
+            BannerVariant(
+                source_hash=source_hash,
+                variant=variant,
+                format=image_format,
+                width=width,
+                mimetype=mimetype,
+            )
+        )
+
+    if not variants:
+        return 0
+
+    db.session.add_all(variants)
+
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # Another process stored the same variants first.
+        db.session.rollback()
+        return 0
+
+    Log.info(f"Banner: {source_hash} | {len(variants)} variants stored")
+
+    return len(variants)
+
+
+def process_fallback_banner(source_hash):
+    """
+    Stores a full size copy of a banner without its metadata right away, so
+    that the banner is never sent with the metadata of its upload. The EXIF
+    orientation is applied and the image is saved without optimizing, the
+    resizing and the final encodings are left to the worker thread.
+
+    Parameters:
+        source_hash (str): The content hash of the uploaded banner.
+
+    Returns:
+        bool: True when the copy was stored.
+    """
+    sendable = db.session.execute(
+        select(BannerVariant.variant).where(
+            BannerVariant.source_hash == source_hash,
+            BannerVariant.variant.in_((STRIPPED_VARIANT, "original")),
+        )
+    ).first()
+
+    if sendable:
+        return False
+
+    try:
+        image_bytes = read_banner_file(banner_file_name(source_hash))
+
+        if image_bytes is None:
+            Log.warning(f"Banner: {source_hash} | File is missing, no copy made")
+            return False
+
+        image, image_format = _open_upload(image_bytes)
+        output = BytesIO()
+        image.save(
+            output,
+            format=image_format.upper(),
+            **STRIPPED_ENCODER_OPTIONS[image_format],
+        )
+
+        write_banner_file(
+            banner_file_name(source_hash, STRIPPED_VARIANT, image_format),
+            output.getvalue(),
+        )
+        db.session.add(
+            BannerVariant(
+                source_hash=source_hash,
+                variant=STRIPPED_VARIANT,
+                format=image_format,
+                width=image.width,
+                mimetype=f"image/{image_format}",
+            )
+        )
+        db.session.commit()
+    except IntegrityError:
+        # Another request stored the copy of the same banner first.
+        db.session.rollback()
+        return False
+    except Exception as e:
+        db.session.rollback()
+        Log.error(f"Failed to strip banner {source_hash}: {e}")
+        return False
+
+    return True
+
+
+def prune_banner_variants():
+    """
+    Deletes the variants and files of banners that no post uses anymore.
+
+    Returns:
+        int: The number of files deleted.
+    """
+    db.session.execute(
+        delete(BannerVariant).where(
+            BannerVariant.source_hash.not_in(
+                select(PostBanner.hash).where(PostBanner.hash.is_not(None))
+            )
+        )
+    )
+    db.session.commit()
+
+    used_hashes = set(
+        db.session.scalars(
+            select(PostBanner.hash).where(PostBanner.hash.is_not(None))
+        ).all()
+    )
+
+    return prune_banner_files(used_hashes)
+
+
+def pending_banner_hashes():
+    """
+    Returns the hashes of the banners the worker has not processed yet, the
+    stripped copy made on upload doesn't count.
+    """
+    return db.session.scalars(
+        select(PostBanner.hash)
+        .where(
+            PostBanner.hash.is_not(None),
+            PostBanner.hash.not_in(
+                select(BannerVariant.source_hash).where(BannerVariant.variant == "card")
+            ),
+        )
+        .distinct()
+    ).all()
+
+
+def enqueue_banner(source_hash):
+    """
+    Queues a banner for processing by the worker thread.
+    """
+    if source_hash:
+        _queue.put(source_hash)
+
+
+def start_banner_processor(app):
+    """
+    Starts a daemon thread that processes queued banners and prunes unused
+    ones every BANNER_PRUNE_INTERVAL seconds, and queues every banner that
+    has no variants yet.
+
+    Parameters:
+        app (Flask): The application whose database the banners are stored in.
+
+    Returns:
+        None
+    """
+
+    def prune():
+        with app.app_context():
+            try:
+                pruned = prune_banner_variants()
+                if pruned:
+                    Log.info(f"Pruned {pruned} unused banner files")
+            except Exception as e:
+                db.session.rollback()
+                Log.error(f"Failed to prune banner variants: {e}")
+
+    def process_loop():
+        # Pruning walks the whole banner store, so it runs at startup and
+        # every BANNER_PRUNE_INTERVAL seconds rather than after each banner.
+        next_prune = 0
+
+        while True:
+            if monotonic() >= next_prune:
+                prune()
+                next_prune = monotonic() + Settings.BANNER_PRUNE_INTERVAL
+
+            try:
+                source_hash = _queue.get(timeout=max(0, next_prune - monotonic()))
+            except Empty:
+                continue
+
+            with app.app_context():
+                try:
+                    process_banner(source_hash)
+                except Exception as e:
+                    db.session.rollback()
+                    Log.error(f"Failed to process banner {source_hash}: {e}")
+
+    with app.app_context():
+        pending = pending_banner_hashes()
+
+    for source_hash in pending:
+        enqueue_banner(source_hash)
+
+    Thread(target=process_loop, name="banner-processor", daemon=True).start()
+
+    Log.info(
+        f"Banner processor started, formats: {', '.join(MODERN_FORMATS)}, "
+        f"{len(pending)} banners queued"
+    )
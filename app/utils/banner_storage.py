@@ -0,0 +1,175 @@
+"""
+This module contains the file storage of post banner images.
+
+Banners are stored as files under BANNER_STORAGE_ROOT, named after the
+SHA-256 hash of the uploaded bytes, so an image uploaded for several posts
+is stored once. Variants are stored next to their upload as
+<hash>.<variant>.<format>. Files are spread over subdirectories named after
+the first two characters of the hash.
+
+Files are sent with send_file on their path, which lets the WSGI server use
+sendfile and answer Range requests, or handed to the proxy with X-Sendfile
+or X-Accel-Redirect when BANNER_SENDFILE is set.
+"""
+
+import os
+from tempfile import NamedTemporaryFile
+from time import time
+
+from flask import current_app, make_response, request, send_file
+from werkzeug.utils import send_file as werkzeug_send_file
+
+from settings import Settings
+
+# Files younger than this are never pruned, an upload is written before the
+# post that uses it is committed.
+PRUNE_MIN_AGE = 3600
+
+
+def banner_storage_root():
+    """
+    Returns the absolute path of the banner storage directory.
+    """
+    return os.path.abspath(Settings.BANNER_STORAGE_ROOT)
+
+
+def banner_file_name(source_hash, variant=None, image_format=None):
+    """
+    Returns the path of a banner file relative to the storage root.
+
+    Parameters:
+        source_hash (str): The content hash of the uploaded banner.
+        variant (str, optional): The variant, the upload itself when omitted.
+        image_format (str, optional): The format of the variant.
+
+    Returns:
+        str: The relative path, using forward slashes.
+    """
+    name = source_hash if variant is None else f"{source_hash}.{variant}.{image_format}"
+    return f"{source_hash[:2]}/{name}"
+
+
+def banner_file_path(name):
+    """
+    Returns the absolute path of a banner file.
+    """
+    return os.path.join(banner_storage_root(), *name.split("/"))
+
+
+def write_banner_file(name, data):
+    """
+    Writes a banner file unless it already exists. The file is written under
+    a temporary name and renamed, so readers never see a partial file.
+
+    Parameters:
+        name (str): The relative path from banner_file_name().
+        data (bytes): The image.
+
+    Returns:
+        bool: True when the file was written, False when it already existed.
+    """
+    path = banner_file_path(name)
+
+    if os.path.exists(path):
+        return False
+
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+
+    with NamedTemporaryFile(dir=directory, prefix=".tmp-", delete=False) as file:
+        file.write(data)
+
+    os.replace(file.name, path)
+
+    return True
+
+
+def read_banner_file(name):
+    """
+    Returns the bytes of a banner file, or None when it doesn't exist.
+    """
+    try:
+        with open(banner_file_path(name), "rb") as file:
+            return file.read()
+    except FileNotFoundError:
+        return None
+
+
+def banner_file_exists(name):
+    """
+    Returns True when the banner file exists.
+    """
+    return os.path.isfile(banner_file_path(name))
+
+
+def send_banner_file(name, mimetype, etag):
+    """
+    Returns a response that sends a banner file.
+
+    Parameters:
+        name (str): The relative path from banner_file_name().
+        mimetype (str): The mimetype of the image.
+        etag (str): The ETag of the response.
+
+    Returns:
+        Response: The file response, or an empty response carrying the
+        X-Accel-Redirect header for the proxy.
+    """
+    path = banner_file_path(name)
+
+    if Settings.BANNER_SENDFILE == "X-Accel-Redirect":
+        response = make_response("")
+        response.headers["X-Accel-Redirect"] = (
+            Settings.BANNER_ACCEL_REDIRECT_PREFIX.rstrip("/") + "/" + name
+        )
+        response.mimetype = mimetype
+        response.set_etag(etag)
+        return response
+
+    if Settings.BANNER_SENDFILE == "X-Sendfile":
+        return werkzeug_send_file(
+            path,
+            request.environ,
+            mimetype=mimetype,
+            etag=etag,
+            conditional=True,
+            use_x_sendfile=True,
+            response_class=current_app.response_class,
+        )
+
+    return send_file(path, mimetype=mimetype, etag=etag, conditional=True)
+
+
+def prune_banner_files(used_hashes):
+    """
+    Deletes the banner files, and their variants, whose upload hash is not in
+    used_hashes and that are older than PRUNE_MIN_AGE.
+
+    Parameters:
+        used_hashes (set): The hashes of the banners in use.
+
+    Returns:
+        int: The number of files deleted.
+    """
+    root = banner_storage_root()
+    cutoff = time() - PRUNE_MIN_AGE
+    deleted = 0
+
+    if not os.path.isdir(root):
+        return 0
+
+    for directory, _, file_names in os.walk(root):
+        for file_name in file_names:
+            if file_name.split(".", 1)[0] in used_hashes:
+                continue
+
+            path = os.path.join(directory, file_name)
+
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    deleted += 1
+            except FileNotFoundError:
+                pass
+
+    return deleted
@@ -19,7 +19,7 @@ def browser_language():
             browser_language = browser_language.split(",")[0].split("-")[0]
             if browser_language in Settings.LANGUAGES:
                 session["language"] = browser_language
-                Log.info(f"Browser language detected and set to: {browser_language}")
+                Log.info("Browser language detected and set to: %s", browser_language)
             else:
                 session["language"] = "en"
                 Log.warning(
@@ -29,4 +29,4 @@ def browser_language():
             session["language"] = "en"
             Log.warning("No browser language detected. Defaulting to English.")
     else:
-        Log.info(f"Language already set in session: {session['language']}")
+        Log.info("Language already set in session: %s", session["language"])
@@ -2,13 +2,15 @@
 This module contains the function to calculate the estimated reading time in minutes for a given post content.
 """
 
-from re import sub
+import re
+
+HTML_TAGS = re.compile(r"<[^>]+>")
 
 
 def calculate_read_time(content):
     """Calculate the estimated reading time in minutes for a given post content."""
 
-    clean_text = sub(r"<[^>]+>", "", content)
+    clean_text = HTML_TAGS.sub("", content)
 
     word_count = len(clean_text.split())
     reading_time = max(1, round(word_count / 200))
@@ -0,0 +1,37 @@
+"""
+This module contains the read path for comment listings.
+
+Comment lists link every comment to its post. The post's url_id, title and
+slug are joined into the comment rows so a listing costs one query instead of
+one post lookup per comment.
+"""
+
+from sqlalchemy import select
+
+from database import db
+from models import Comment, Post
+
+
+def select_comment_rows():
+    """
+    Returns a Core select of every comment with the url_id, title and slug of its post.
+
+    Rows are (id, post_id, comment, username, time_stamp, url_id, title, slug).
+    """
+    return select(
+        Comment.id,
+        Comment.post_id,
+        Comment.comment,
+        Comment.username,
+        Comment.time_stamp,
+        Post.url_id,
+        Post.title,
+        Post.slug,
+    ).outerjoin(Post, Post.id == Comment.post_id)
+
+
+def get_comment_rows(statement):
+    """
+    Executes a select_comment_rows() select and returns its rows.
+    """
+    return db.session.execute(statement).all()
@@ -0,0 +1,90 @@
+"""
+This module contains the conditional GET support of post pages.
+
+A post page is identified by an ETag derived from the post's last edit, its
+comments and the viewer's language, theme, login and CSRF token window.
+Clients that send a matching If-None-Match get a 304 before the page is
+rendered.
+
+Post pages carry no Last-Modified date. A modification date can't tell two
+viewers or two token windows apart, so If-Modified-Since could revalidate a
+page rendered for another login state or with an expired CSRF token.
+"""
+
+from hashlib import sha1
+from time import time
+
+from flask import make_response, request, session
+from sqlalchemy import func, select
+
+from database import db
+from models import Comment
+from utils.markdown_renderer import RENDERER_VERSION
+
+# Pages embed a CSRF token that expires after an hour, validators roll over
+# every half hour so a revalidated page never carries an expired one.
+TOKEN_WINDOW = 1800
+
+
+def post_etag(post):
+    """
+    Returns the ETag of a post page for the current viewer.
+
+    Parameters:
+        post (Post): The post whose page is validated.
+
+    Returns:
+        str: The ETag.
+    """
+    latest_comment, comment_count = db.session.execute(
+        select(func.max(Comment.time_stamp), func.count(Comment.id)).where(
+            Comment.post_id == post.id
+        )
+    ).one()
+
+    fingerprint = ":".join(
+        str(part)
+        for part in (
+            post.id,
+            post.last_edit_time_stamp,
+            latest_comment,
+            comment_count,
+            RENDERER_VERSION,
+            session.get("language", "en"),
+            session.get("theme", "winter"),
+            session.get("username", ""),
+            int(time()) // TOKEN_WINDOW,
+        )
+    )
+
+    return sha1(fingerprint.encode("utf-8")).hexdigest()
+
+
+def is_not_modified(etag):
+    """
+    Returns True when the request's If-None-Match header matches the ETag.
+
+    If-Modified-Since is ignored, see the module docstring. Pages with
+    pending flash messages are always sent in full.
+    """
+    if session.get("_flashes"):
+        return False
+
+    return request.if_none_match.contains(etag)
+
+
+def set_validators(response, etag):
+    """
+    Adds the ETag to a response and makes clients revalidate it on every use.
+    """
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+
+def not_modified_response(etag):
+    """
+    Returns an empty 304 response carrying the ETag.
+    """
+    return set_validators(make_response("", 304), etag)
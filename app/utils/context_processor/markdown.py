@@ -1,10 +1,5 @@
-from utils.markdown_renderer import SafeMarkdownRenderer
-
-_renderer = SafeMarkdownRenderer()
+from utils.markdown_renderer import render_markdown
 
 
 def markdown_processor():
-    def render_markdown(text):
-        return _renderer.render(text)
-
     return dict(render_markdown=render_markdown)
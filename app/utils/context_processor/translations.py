@@ -18,5 +18,5 @@ def inject_translations():
     """
     language = session.get("language", "en")
     translations = load_translations(language)
-    Log.info(f"Injecting translations for language: {language}")
+    Log.info("Injecting translations for language: %s", language)
     return dict(translations=translations)
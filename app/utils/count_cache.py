@@ -0,0 +1,103 @@
+"""
+This module contains the row count cache used for pagination totals.
+
+Counts are cached per key, e.g. "posts" or "posts:category:code". The writes
+that change a count adjust the cached value in place, and every entry expires
+after COUNT_CACHE_TTL seconds so counts changed by other processes or by
+unhandled writes converge on their own.
+"""
+
+from threading import Lock
+from time import monotonic
+
+from sqlalchemy import Select, func, select
+
+from database import db
+from settings import Settings
+from utils.log import Log
+
+_counts = {}
+_lock = Lock()
+
+
+def posts_count_key(category=None, author=None):
+    """
+    Returns the count key of all posts, or of the posts in a category or by an author.
+    """
+    if category:
+        return f"posts:category:{category.lower()}"
+    if author:
+        return f"posts:author:{author}"
+    return "posts"
+
+
+def post_count_keys(category, author):
+    """
+    Returns every count key a post with the given category and author is counted under.
+    """
+    return (
+        posts_count_key(),
+        posts_count_key(category=category),
+        posts_count_key(author=author),
+    )
+
+
+def get_count(key, query):
+    """
+    Returns the cached row count for the key, counting the query on a miss.
+
+    Parameters:
+        key (str): The cache key of the count.
+        query: The SQLAlchemy query or Core select whose rows are counted.
+
+    Returns:
+        int: The number of rows.
+    """
+    now = monotonic()
+
+    with _lock:
+        entry = _counts.get(key)
+
+    if entry and entry[1] > now:
+        return entry[0]
+
+    count = count_rows(query)
+
+    with _lock:
+        _counts[key] = (count, now + Settings.COUNT_CACHE_TTL)
+
+    Log.info(f"Count cache miss for {key}: {count}")
+
+    return count
+
+
+def count_rows(query):
+    """
+    Returns the exact row count of a SQLAlchemy query or Core select.
+    """
+    if isinstance(query, Select):
+        return db.session.scalar(
+            select(func.count()).select_from(query.order_by(None).subquery())
+        )
+
+    return query.order_by(None).count()
+
+
+def adjust_count(delta, *keys):
+    """
+    Adds delta to the cached counts of the keys that are cached.
+    """
+    with _lock:
+        for key in keys:
+            entry = _counts.get(key)
+            if entry:
+                _counts[key] = (max(entry[0] + delta, 0), entry[1])
+
+
+def invalidate_count(*keys):
+    """
+    Drops the cached counts of the keys, they are recounted on the next read.
+    """
+    with _lock:
+        for key in keys:
+            _counts.pop(key, None)
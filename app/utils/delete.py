@@ -17,8 +17,10 @@ from flask import redirect, session
 
 from database import db
 from models import Comment, Post, User
+from utils.count_cache import adjust_count, invalidate_count, post_count_keys
 from utils.flash_message import flash_message
 from utils.log import Log
+from utils.page_cache import invalidate_page_cache, invalidate_post_pages
 
 
 def delete_post(post_id):
@@ -34,9 +36,15 @@ def delete_post(post_id):
     post = Post.query.get(post_id)
 
     if post:
+        count_keys = post_count_keys(post.category, post.author)
+
         db.session.delete(post)
         db.session.commit()
 
+        adjust_count(-1, *count_keys)
+        invalidate_count("comments")
+        invalidate_page_cache()
+
         flash_message(
             page="delete",
             message="post",
@@ -71,6 +79,8 @@ def delete_user(username):
 
     db.session.delete(user)
     db.session.commit()
+    adjust_count(-1, "users")
+    invalidate_page_cache()
 
     flash_message(
         page="delete",
@@ -102,6 +112,8 @@ def delete_comment(comment_id):
     if comment:
         db.session.delete(comment)
         db.session.commit()
+        adjust_count(-1, "comments")
+        invalidate_post_pages(comment.post_id)
 
         flash_message(
             page="delete",
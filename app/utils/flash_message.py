@@ -1,8 +1,7 @@
-from json import load
-from os.path import exists
-
 from flask import flash
 
+from utils.translations import load_translations
+
 
 def flash_message(page="error", message="wrong_call", category="error", language="en"):
     """
@@ -17,11 +16,6 @@ def flash_message(page="error", message="wrong_call", category="error", language
     Returns:
         None
     """
-    text = None
-    translation_file = f"./translations/{language}.json"
-    if exists(translation_file):
-        with open(translation_file, "r", encoding="utf-8") as file:
-            translations = load(file)
-            text = translations["flash"]
+    text = load_translations(language)["flash"]
     flash(text[page][message], category)
     return None
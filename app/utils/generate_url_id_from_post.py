@@ -1,3 +1,4 @@
+import re
 import uuid
 
 from models import Post
@@ -36,18 +37,18 @@ AVOID_CHARACTERS = [
     ",",
 ]
 
+# Maps every character to avoid to a dash in a single str.translate pass.
+SLUG_TRANSLATION = str.maketrans(dict.fromkeys(AVOID_CHARACTERS, "-"))
+DASH_RUNS = re.compile(r"-{2,}")
+
 
 def get_new_uid():
     return str(uuid.uuid4())[24:]
 
 
 def get_slug_from_post_title(post_title):
-    cleaned_title = "".join(
-        ["-" if char in AVOID_CHARACTERS else char for char in post_title]
-    )
-    filtered_words = [word for word in cleaned_title.split("-") if word]
-    final_url = "-".join(filtered_words)
-    return f"{final_url}".lower()
+    cleaned_title = post_title.translate(SLUG_TRANSLATION)
+    return DASH_RUNS.sub("-", cleaned_title).strip("-").lower()
 
 
 def generate_url_id():
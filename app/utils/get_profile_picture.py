@@ -1,25 +1,91 @@
-from sqlalchemy import func
+from flask import g, has_app_context, session
+from sqlalchemy import func, select
 
+from database import db
 from models import User
 from utils.log import Log
 
 
+def _get_memo():
+    """
+    Returns the profile pictures resolved during the current request, keyed by
+    lowercase username. Outside of an app context nothing is memoized.
+    """
+    if not has_app_context():
+        return {}
+
+    if "profile_pictures" not in g:
+        g.profile_pictures = {}
+
+    return g.profile_pictures
+
+
+def preload_profile_pictures(usernames):
+    """
+    Resolves the profile pictures of the users with the specified usernames in
+    one query and memoizes them for the rest of the request. The logged in
+    user is included so the navbar avatar needs no query of its own.
+
+    Parameters:
+        usernames (iterable of str): The usernames whose profile pictures are to be resolved.
+
+    Returns:
+        None
+    """
+    memo = _get_memo()
+    usernames = set(usernames)
+
+    if session.get("username"):
+        usernames.add(session["username"])
+
+    missing = {username.lower() for username in usernames} - memo.keys()
+
+    if not missing:
+        return
+
+    rows = db.session.execute(
+        select(func.lower(User.username), User.profile_picture).where(
+            func.lower(User.username).in_(missing)
+        )
+    )
+
+    for username, profile_picture in rows:
+        memo[username] = profile_picture
+
+    for username in missing - memo.keys():
+        memo[username] = None
+
+    Log.info(f"Preloaded profile pictures of {len(missing)} users")
+
+
 def get_profile_picture(username):
     """
     Returns the profile picture of the user with the specified username.
 
+    Pictures preloaded with preload_profile_pictures() or resolved earlier in
+    the same request are returned without a query.
+
     Parameters:
         username (str): The username of the user whose profile picture is to be retrieved.
 
     Returns:
         str or None: The profile picture URL of the user, or None if not found.
     """
-    user = User.query.filter(func.lower(User.username) == username.lower()).first()
+    memo = _get_memo()
+    username_lower = username.lower()
+
+    if username_lower in memo:
+        return memo[username_lower]
+
+    user = User.query.filter(func.lower(User.username) == username_lower).first()
 
     if user:
         profile_picture = user.profile_picture
-        Log.info(f"Returning {username}'s profile picture: {profile_picture}")
-        return profile_picture
+        Log.info("Returning %s's profile picture: %s", username, profile_picture)
     else:
+        profile_picture = None
         Log.error(f"Failed to retrieve profile picture for user: {username}")
-        return None
+
+    memo[username_lower] = profile_picture
+
+    return profile_picture
@@ -0,0 +1,88 @@
+"""
+This module contains the functions that keep the stored post hot scores fresh.
+"""
+
+from threading import Thread
+from time import sleep
+
+from sqlalchemy import func, update
+
+from database import db
+from models import Post
+from settings import Settings
+from utils.log import Log
+from utils.time import current_time_stamp
+
+GRAVITY = 1.8
+
+
+def calculate_hot_score(views, time_stamp):
+    """
+    Calculates the hot score of a post from its views and creation time.
+
+    Parameters:
+        views (int): The view count of the post.
+        time_stamp (int): The creation time stamp of the post, None counts as now.
+
+    Returns:
+        float: The hot score of the post.
+    """
+    now = current_time_stamp()
+    age_hours = (now - (now if time_stamp is None else time_stamp)) / 3600
+    return (views or 0) / ((age_hours + 2) ** GRAVITY)
+
+
+def refresh_hot_scores(post_ids=None):
+    """
+    Recomputes the stored hot score of every post in a single UPDATE. Posts
+    without a creation time stamp are scored as if they were created now.
+
+    Parameters:
+        post_ids (list, optional): Only refresh the posts with these IDs.
+
+    Returns:
+        None
+    """
+    now = current_time_stamp()
+    age_hours = (now - func.coalesce(Post.time_stamp, now)) / 3600.0
+    statement = update(Post).values(
+        hot_score=func.coalesce(Post.views, 0) / func.pow(age_hours + 2, GRAVITY)
+    )
+
+    if post_ids is not None:
+        statement = statement.where(Post.id.in_(post_ids))
+
+    result = db.session.execute(statement)
+    db.session.commit()
+
+    Log.info(f"Hot scores refreshed for {result.rowcount} posts")
+
+
+def start_hot_score_refresher(app):
+    """
+    Starts a daemon thread that refreshes the hot scores every
+    HOT_SCORE_REFRESH_INTERVAL seconds, beginning right away.
+
+    Parameters:
+        app (Flask): The application whose database is refreshed.
+
+    Returns:
+        None
+    """
+
+    def refresh_loop():
+        while True:
+            with app.app_context():
+                try:
+                    refresh_hot_scores()
+                except Exception as e:
+                    db.session.rollback()
+                    Log.error(f"Failed to refresh hot scores: {e}")
+
+            sleep(Settings.HOT_SCORE_REFRESH_INTERVAL)
+
+    Thread(target=refresh_loop, name="hot-score-refresher", daemon=True).start()
+
+    Log.info(
+        f"Hot score refresher started, interval: {Settings.HOT_SCORE_REFRESH_INTERVAL}s"
+    )
@@ -1,20 +1,349 @@
 """
 This module contains the code for the Log variable.
+
+Log records are stamped and put on a bounded in-memory queue and the call
+returns right away. A background writer thread takes them off the queue in
+batches of up to LOG_BATCH_SIZE, prints them to the console through Tamga
+and appends them to the rotating log.log and log.jsonl sinks of
+utils/log_sink.py, so request threads never wait on file I/O or JSON
+encoding.
+
+When LOG_QUEUE_SIZE records are waiting, new records are dropped and counted,
+and the writer logs how many were lost. Records still queued at exit are
+written before the process ends. LOG_QUEUE_SIZE=0 writes every record in the
+calling thread instead.
+
+Records below LOG_LEVEL are discarded before they are queued. LOG_MODULE_LEVELS
+overrides the level for the modules it names and their submodules, and only
+a LOG_INFO_SAMPLE_RATE fraction of the INFO records that pass is kept.
+Messages are %-formatted with the positional arguments of the call, so a
+filtered record costs no formatting:
+
+    Log.info("Paginating query, page %s", page)
 """
 
+import atexit
+import os
+import sys
 from os import mkdir
 from os.path import exists
+from queue import Empty, Full, Queue
+from random import random
+from threading import Lock, Thread
+from time import time
 
-from settings import Settings
 from tamga import Tamga
 
+from settings import Settings
+from utils.log_sink import RotatingFileSink, json_line, text_line
+
 if not exists(Settings.LOG_FOLDER_ROOT):
     mkdir(Settings.LOG_FOLDER_ROOT)
 
-Log = Tamga(
-    file_output=Settings.LOG_TO_FILE,
-    json_output=Settings.LOG_TO_JSON,
-    console_output=Settings.TAMGA_LOGGER,
-    file_path=Settings.LOG_FILE_ROOT,
-    json_path=Settings.LOG_JSON_ROOT,
+# Tamga's colors for each level.
+LEVEL_COLORS = {
+    "INFO": "sky",
+    "WARNING": "amber",
+    "ERROR": "rose",
+    "SUCCESS": "emerald",
+    "DEBUG": "indigo",
+    "CRITICAL": "red",
+    "DATABASE": "green",
+    "METRIC": "cyan",
+    "TRACE": "gray",
+}
+
+# Severity of each level, records below the configured level are discarded.
+LEVEL_VALUES = {
+    "TRACE": 5,
+    "DEBUG": 10,
+    "INFO": 20,
+    "DATABASE": 20,
+    "METRIC": 20,
+    "SUCCESS": 25,
+    "WARNING": 30,
+    "ERROR": 40,
+    "CRITICAL": 50,
+}
+
+# Seconds the exit handler waits for the writer to empty the queue.
+SHUTDOWN_TIMEOUT = 5
+
+_STOP = object()
+
+
+def parse_module_levels(module_levels):
+    """
+    Returns a {module: level value} dict from a "module=LEVEL,module=LEVEL" string.
+    """
+    levels = {}
+
+    for entry in module_levels.split(","):
+        if "=" not in entry:
+            continue
+
+        module, level = (part.strip() for part in entry.split("=", 1))
+        levels[module] = LEVEL_VALUES[level.upper()]
+
+    return levels
+
+
+class QueuedLog:
+    """
+    Logs to the console and to file sinks from a background thread.
+
+    Parameters:
+        writer (Tamga): The logger records are printed to the console with.
+        sinks (list): The RotatingFileSink instances records are appended to.
+        queue_size (int): Maximum number of waiting records, 0 writes synchronously.
+        batch_size (int): Maximum number of records written between flushes.
+        level (str): Lowest level that is logged.
+        module_levels (dict): Lowest level value per module name prefix.
+        info_sample_rate (float): Fraction of INFO records that are logged.
+    """
+
+    def __init__(
+        self,
+        writer,
+        sinks,
+        queue_size,
+        batch_size,
+        level="TRACE",
+        module_levels=None,
+        info_sample_rate=1.0,
+    ):
+        self.writer = writer
+        self.sinks = sinks
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.level = LEVEL_VALUES[level.upper()]
+        self.module_levels = module_levels or {}
+        self.info_sample_rate = info_sample_rate
+        self._module_level_cache = {}
+        self.dropped = 0
+        self._reported_drops = 0
+        self._queue = None
+        self._thread = None
+        self._pid = None
+        self._lock = Lock()
+
+    def _ensure_writer_thread(self):
+        # Threads don't survive a fork, each worker process starts its own
+        # writer with an empty queue.
+        if self._pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+
+            self._queue = Queue(maxsize=self.queue_size)
+            self._thread = Thread(target=self._run, name="log-writer", daemon=True)
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def _module_level(self, module):
+        level = self._module_level_cache.get(module)
+
+        if level is None:
+            level = self.level
+            matched = ""
+
+            for prefix, prefix_level in self.module_levels.items():
+                if (module == prefix or module.startswith(prefix + ".")) and len(
+                    prefix
+                ) > len(matched):
+                    level, matched = prefix_level, prefix
+
+            self._module_level_cache[module] = level
+
+        return level
+
+    def is_enabled(self, level, module=None):
+        """
+        Returns True when a record of the level logged from the module, the
+        calling module by default, passes the level threshold.
+        """
+        if module is None:
+            module = sys._getframe(1).f_globals.get("__name__", "")
+
+        return LEVEL_VALUES[level] >= self._module_level(module)
+
+    def _log(self, level, message, args, kwargs):
+        module = sys._getframe(2).f_globals.get("__name__", "")
+
+        if LEVEL_VALUES[level] < self._module_level(module):
+            return
+
+        if (
+            level == "INFO"
+            and self.info_sample_rate < 1
+            and (random() >= self.info_sample_rate)
+        ):
+            return
+
+        if args:
+            message = message % args
+
+        self._enqueue(level, message, kwargs)
+
+    def _enqueue(self, level, message, kwargs):
+        record = (level, message, kwargs, time())
+
+        if self.queue_size <= 0:
+            self._write_batch([record])
+            return
+
+        self._ensure_writer_thread()
+
+        try:
+            self._queue.put_nowait(record)
+        except Full:
+            with self._lock:
+                self.dropped += 1
+
+    def _run(self):
+        queue = self._queue
+
+        while True:
+            record = queue.get()
+            batch = []
+
+            while record is not _STOP:
+                batch.append(record)
+
+                if len(batch) >= self.batch_size:
+                    break
+
+                try:
+                    record = queue.get_nowait()
+                except Empty:
+                    break
+
+            self._write_batch(batch)
+
+            for _ in range(len(batch) + (record is _STOP)):
+                queue.task_done()
+
+            if record is _STOP:
+                return
+
+    def _write_batch(self, batch):
+        with self._lock:
+            dropped = self.dropped - self._reported_drops
+            self._reported_drops = self.dropped
+
+        if dropped:
+            batch = [
+                ("WARNING", f"Log queue full, dropped {dropped} records", {}, time()),
+                *batch,
+            ]
+
+        if self.writer.console_output:
+            try:
+                for level, message, kwargs, _ in batch:
+                    if kwargs:
+                        message += self.writer._format_kwargs(**kwargs)
+                    self.writer.log(message, level, LEVEL_COLORS[level])
+            except Exception as e:
+                print(f"Failed to print {len(batch)} log records: {e}", file=sys.stderr)
+
+        records = [
+            {"level": level, "message": message, "data": kwargs, "timestamp": created}
+            for level, message, kwargs, created in batch
+        ]
+
+        for sink in self.sinks:
+            try:
+                sink.write(records)
+            except Exception as e:
+                print(
+                    f"Failed to write {len(records)} log records to {sink.path}: {e}",
+                    file=sys.stderr,
+                )
+
+    def flush(self):
+        """
+        Blocks until every queued record is written.
+        """
+        if self._pid == os.getpid() and self._thread.is_alive():
+            self._queue.join()
+
+    def close(self):
+        """
+        Writes the queued records and stops the writer thread.
+        """
+        if self._pid == os.getpid() and self._thread.is_alive():
+            try:
+                self._queue.put(_STOP, timeout=SHUTDOWN_TIMEOUT)
+            except Full:
+                pass
+            self._thread.join(SHUTDOWN_TIMEOUT)
+
+        # Records logged by later exit handlers are written synchronously.
+        self.queue_size = 0
+
+        for sink in self.sinks:
+            sink.close()
+
+    def info(self, message, *args, **kwargs):
+        self._log("INFO", message, args, kwargs)
+
+    def warning(self, message, *args, **kwargs):
+        self._log("WARNING", message, args, kwargs)
+
+    def error(self, message, *args, **kwargs):
+        self._log("ERROR", message, args, kwargs)
+
+    def success(self, message, *args, **kwargs):
+        self._log("SUCCESS", message, args, kwargs)
+
+    def debug(self, message, *args, **kwargs):
+        self._log("DEBUG", message, args, kwargs)
+
+    def critical(self, message, *args, **kwargs):
+        self._log("CRITICAL", message, args, kwargs)
+
+    def database(self, message, *args, **kwargs):
+        self._log("DATABASE", message, args, kwargs)
+
+    def metric(self, message, *args, **kwargs):
+        self._log("METRIC", message, args, kwargs)
+
+    def trace(self, message, *args, **kwargs):
+        self._log("TRACE", message, args, kwargs)
+
+
+def _rotating_sink(path, format_record):
+    return RotatingFileSink(
+        path,
+        format_record,
+        max_bytes=Settings.LOG_ROTATE_MAX_MB * 1024 * 1024,
+        interval=Settings.LOG_ROTATE_INTERVAL,
+        compress=Settings.LOG_ROTATE_COMPRESS,
+        backups=Settings.LOG_ROTATE_BACKUPS,
+    )
+
+
+Log = QueuedLog(
+    Tamga(
+        file_output=False,
+        json_output=False,
+        console_output=Settings.TAMGA_LOGGER,
+    ),
+    [
+        sink
+        for enabled, sink in (
+            (Settings.LOG_TO_FILE, _rotating_sink(Settings.LOG_FILE_ROOT, text_line)),
+            (Settings.LOG_TO_JSON, _rotating_sink(Settings.LOG_JSON_ROOT, json_line)),
+        )
+        if enabled
+    ],
+    queue_size=Settings.LOG_QUEUE_SIZE,
+    batch_size=Settings.LOG_BATCH_SIZE,
+    level=Settings.LOG_LEVEL,
+    module_levels=parse_module_levels(Settings.LOG_MODULE_LEVELS),
+    info_sample_rate=Settings.LOG_INFO_SAMPLE_RATE,
 )
+
+atexit.register(Log.close)
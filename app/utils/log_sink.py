@@ -0,0 +1,199 @@
+"""
+This module contains the rotating log file sinks.
+
+A sink appends one line per log record to its file: log.log gets plain text
+lines and log.jsonl gets one JSON object per line (NDJSON), so both can be
+tailed and streamed line by line. A sink starts a new segment when the file
+grows past its size limit or when a new rotation interval begins. The old
+segment is renamed with a timestamp suffix and optionally gzipped, and only
+the newest segments are kept.
+
+Several worker processes may append to the same file. The file is opened in
+append mode, rotation is serialized with a lock file where fcntl is
+available, and a process whose file was rotated away by another process
+reopens the path before its next write.
+"""
+
+import gzip
+import json
+import os
+import shutil
+from datetime import datetime
+from glob import escape, glob
+from time import time, tzname
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+DATE_FORMAT = "%d.%m.%y"
+TIME_FORMAT = "%H:%M:%S"
+SEGMENT_SUFFIX_FORMAT = "%Y%m%d-%H%M%S"
+
+
+def text_line(record):
+    """
+    Returns a record as a log.log line, in Tamga's file format.
+    """
+    created = datetime.fromtimestamp(record["timestamp"])
+    message = record["message"]
+
+    if record["data"]:
+        message += " | " + ", ".join(
+            f"{key}={value!r}" for key, value in record["data"].items()
+        )
+
+    return (
+        f"[{created.strftime(DATE_FORMAT)} | {created.strftime(TIME_FORMAT)} | "
+        f"{tzname[0]}] {record['level']}: {message}"
+    )
+
+
+def json_line(record):
+    """
+    Returns a record as one NDJSON line, with the fields of Tamga's JSON log.
+    """
+    created = datetime.fromtimestamp(record["timestamp"])
+
+    return json.dumps(
+        {
+            "level": record["level"],
+            "message": record["message"],
+            "data": record["data"],
+            "date": created.strftime(DATE_FORMAT),
+            "time": created.strftime(TIME_FORMAT),
+            "timezone": tzname[0],
+            "timestamp": record["timestamp"],
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+
+
+class RotatingFileSink:
+    """
+    Appends formatted log records to a file and rotates it.
+
+    Parameters:
+        path (str): The path of the file.
+        format_record (callable): Returns the line of a record, without newline.
+        max_bytes (int): Size after which the file is rotated, 0 disables it.
+        interval (int): Seconds per segment, aligned to the epoch, 0 disables it.
+        compress (bool): Toggle gzipping rotated segments.
+        backups (int): Number of rotated segments kept, 0 keeps all of them.
+    """
+
+    def __init__(self, path, format_record, max_bytes, interval, compress, backups):
+        self.path = path
+        self.format_record = format_record
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.compress = compress
+        self.backups = backups
+        self._file = None
+        self._inode = None
+        self._segment_start = None
+
+    def _open(self):
+        self._file = open(self.path, "a", encoding="utf-8")  # noqa: SIM115
+        stat = os.fstat(self._file.fileno())
+        self._inode = stat.st_ino
+        self._segment_start = stat.st_mtime if stat.st_size else time()
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _is_rotated_away(self):
+        try:
+            return os.stat(self.path).st_ino != self._inode
+        except FileNotFoundError:
+            return True
+
+    def _should_rotate(self, now):
+        if self.max_bytes and os.fstat(self._file.fileno()).st_size >= self.max_bytes:
+            return True
+
+        return bool(self.interval) and (
+            now // self.interval != self._segment_start // self.interval
+        )
+
+    def _rotate(self, now):
+        with open(self.path + ".lock", "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            # Another process may have rotated the file while we waited.
+            if self._is_rotated_away():
+                self._close()
+                self._open()
+                return
+
+            segment = (
+                self.path
+                + "."
+                + datetime.fromtimestamp(now).strftime(SEGMENT_SUFFIX_FORMAT)
+            )
+            while os.path.exists(segment) or os.path.exists(segment + ".gz"):
+                segment += "_"
+
+            os.replace(self.path, segment)
+
+        self._close()
+        self._open()
+
+        if self.compress:
+            with (
+                open(segment, "rb") as source,
+                gzip.open(segment + ".gz", "wb") as target,
+            ):
+                shutil.copyfileobj(source, target)
+            os.remove(segment)
+
+        self._prune_segments()
+
+    def _prune_segments(self):
+        if not self.backups:
+            return
+
+        segments = sorted(
+            path
+            for path in glob(escape(self.path) + ".*")
+            if not path.endswith(".lock")
+        )
+
+        for path in segments[: -self.backups]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def write(self, records):
+        """
+        Appends the records to the file, rotating it first when it is due.
+        """
+        if not records:
+            return
+
+        now = time()
+
+        if self._file is None or self._is_rotated_away():
+            self._close()
+            self._open()
+
+        if self._should_rotate(now):
+            self._rotate(now)
+
+        self._file.write(
+            "".join(self.format_record(record) + "\n" for record in records)
+        )
+        self._file.flush()
+
+    def close(self):
+        """
+        Closes the file.
+        """
+        self._close()
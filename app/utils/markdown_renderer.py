@@ -1,7 +1,13 @@
-from markdown2 import Markdown
+from threading import local
+
 import bleach
+from markdown2 import Markdown
 from markupsafe import Markup
 
+# Bump whenever the markdown extras or the sanitizer allow lists below change,
+# so post HTML stored by an older configuration gets re-rendered.
+RENDERER_VERSION = 1
+
 
 class SafeMarkdownRenderer:
     def __init__(self):
@@ -75,14 +81,30 @@ class SafeMarkdownRenderer:
                 "spoiler",
             ]
         )
-
-    def render(self, text: str) -> Markup:
-        html = self.md.convert(text or "")
-        clean_html = bleach.clean(
-            html,
+        self.cleaner = bleach.Cleaner(
             tags=self.allowed_tags,
             attributes=self.allowed_attributes,
             protocols=self.allowed_protocols,
             strip=True,
         )
+
+    def render(self, text: str) -> Markup:
+        html = self.md.convert(text or "")
+        clean_html = self.cleaner.clean(html)
         return Markup(clean_html)
+
+
+# Markdown and bleach.Cleaner instances keep per conversion state and are not
+# safe to share between threads, so every thread renders with its own.
+_renderers = local()
+
+
+def get_renderer() -> SafeMarkdownRenderer:
+    renderer = getattr(_renderers, "renderer", None)
+    if renderer is None:
+        renderer = _renderers.renderer = SafeMarkdownRenderer()
+    return renderer
+
+
+def render_markdown(text: str) -> Markup:
+    return get_renderer().render(text)
@@ -0,0 +1,436 @@
+"""
+This module contains the metrics registry exported at /metrics.
+
+Each process counts requests, SQL queries, template render time and login
+password hash time in memory. A writer thread stores a snapshot of the
+process's metrics as METRICS_DIR/<pid>.json every METRICS_FLUSH_INTERVAL
+seconds, and the process that answers /metrics adds up the snapshots of
+every worker, so the export covers all prefork workers whichever one is
+scraped. The snapshots of processes that have exited are folded into
+archive.json, which keeps their counters in the totals.
+
+METRICS_DIR must not be shared between hosts, a snapshot whose pid is not
+running on the scraping host is treated as exited. Empty it when deploying
+to start the counters from zero.
+"""
+
+import atexit
+import json
+import os
+from bisect import bisect_left
+from contextlib import contextmanager
+from glob import glob
+from threading import Lock, Thread
+from time import perf_counter, sleep
+
+from flask import request
+
+from settings import Settings
+from utils.log import Log
+from utils.page_cache import page_cache_stats
+from utils.request_timer import request_timings
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Upper bounds of the duration histogram buckets, in seconds.
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# Type and help text of every exported metric.
+METRICS = {
+    "flaskblog_http_requests_total": (
+        "counter",
+        "HTTP requests by endpoint, method and status code.",
+    ),
+    "flaskblog_http_request_duration_seconds": (
+        "histogram",
+        "HTTP request latency by endpoint.",
+    ),
+    "flaskblog_db_queries_total": (
+        "counter",
+        "SQL statements run while handling requests, by endpoint.",
+    ),
+    "flaskblog_db_query_duration_seconds_total": (
+        "counter",
+        "Time spent in SQL statements while handling requests, by endpoint.",
+    ),
+    "flaskblog_template_render_duration_seconds": (
+        "histogram",
+        "Template render time per request, by endpoint.",
+    ),
+    "flaskblog_login_hash_duration_seconds": (
+        "histogram",
+        "Time spent verifying login passwords.",
+    ),
+    "flaskblog_page_cache_events_total": (
+        "counter",
+        "Page cache hits, misses, evictions and invalidations.",
+    ),
+    "flaskblog_page_cache_entries": (
+        "gauge",
+        "Pages held by the page caches of all workers.",
+    ),
+    "flaskblog_log_dropped_records_total": (
+        "counter",
+        "Log records dropped because the log queue was full.",
+    ),
+}
+
+ARCHIVE_FILE = "archive.json"
+
+_lock = Lock()
+# {(name, labels): value}, labels is a tuple of (label, value) pairs.
+_counters = {}
+# {(name, labels): [bucket counts..., +Inf count, sum]}
+_histograms = {}
+_pid = None
+
+
+def _ensure_writer_thread():
+    global _pid
+
+    # Threads don't survive a fork, each worker process starts its own writer
+    # and counts only its own requests.
+    if _pid == os.getpid():
+        return
+
+    with _lock:
+        if _pid == os.getpid():
+            return
+
+        _counters.clear()
+        _histograms.clear()
+        _pid = os.getpid()
+
+    Thread(target=_write_loop, name="metrics-writer", daemon=True).start()
+
+
+def inc_counter(name, labels=(), value=1):
+    """
+    Adds a value to a counter of this process.
+
+    Parameters:
+        name (str): The metric name, a key of METRICS.
+        labels (tuple): The (label, value) pairs of the series.
+        value (float): The amount added.
+    """
+    if not Settings.METRICS:
+        return
+
+    _ensure_writer_thread()
+
+    with _lock:
+        _counters[name, labels] = _counters.get((name, labels), 0) + value
+
+
+def observe(name, value, labels=()):
+    """
+    Records a duration in a histogram of this process.
+
+    Parameters:
+        name (str): The metric name, a key of METRICS.
+        value (float): The duration in seconds.
+        labels (tuple): The (label, value) pairs of the series.
+    """
+    if not Settings.METRICS:
+        return
+
+    _ensure_writer_thread()
+
+    with _lock:
+        histogram = _histograms.get((name, labels))
+
+        if histogram is None:
+            histogram = _histograms[name, labels] = [0] * (len(DURATION_BUCKETS) + 2)
+
+        histogram[bisect_left(DURATION_BUCKETS, value)] += 1
+        histogram[-1] += value
+
+
+@contextmanager
+def observe_duration(name, labels=()):
+    """
+    Records the duration of the with block in a histogram.
+    """
+    started = perf_counter()
+
+    try:
+        yield
+    finally:
+        observe(name, perf_counter() - started, labels)
+
+
+def record_request(response):
+    """
+    Records the count, latency, SQL and template time of the current request.
+
+    Parameters:
+        response (Response): The response of the request.
+
+    Returns:
+        None
+    """
+    if not Settings.METRICS:
+        return
+
+    timings = request_timings()
+
+    if not timings:
+        return
+
+    endpoint = (("endpoint", request.endpoint or ""),)
+
+    inc_counter(
+        "flaskblog_http_requests_total",
+        (*endpoint, ("method", request.method), ("status", str(response.status_code))),
+    )
+    observe(
+        "flaskblog_http_request_duration_seconds",
+        timings["latency_ms"] / 1000,
+        endpoint,
+    )
+    inc_counter("flaskblog_db_queries_total", endpoint, timings["db_queries"])
+    inc_counter(
+        "flaskblog_db_query_duration_seconds_total", endpoint, timings["db_ms"] / 1000
+    )
+    observe(
+        "flaskblog_template_render_duration_seconds",
+        timings["template_ms"] / 1000,
+        endpoint,
+    )
+
+
+def _snapshot():
+    with _lock:
+        counters = [
+            [name, labels, value] for (name, labels), value in _counters.items()
+        ]
+        histograms = [
+            [name, labels, list(values)]
+            for (name, labels), values in _histograms.items()
+        ]
+
+    stats = page_cache_stats()
+    counters += [
+        ["flaskblog_page_cache_events_total", (("event", event),), stats[event]]
+        for event in ("hits", "misses", "evictions", "invalidations")
+    ]
+    counters.append(["flaskblog_log_dropped_records_total", (), Log.dropped])
+
+    return {
+        "counters": counters,
+        "histograms": histograms,
+        "gauges": [["flaskblog_page_cache_entries", (), stats["size"]]],
+    }
+
+
+def _metrics_dir():
+    return os.path.abspath(Settings.METRICS_DIR)
+
+
+def _write_json(path, data):
+    temp_path = f"{path}.{os.getpid()}.tmp"
+
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump(data, file)
+
+    os.replace(temp_path, path)
+
+
+def _read_json(path):
+    try:
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def write_snapshot():
+    """
+    Stores the metrics of this process in METRICS_DIR.
+    """
+    os.makedirs(_metrics_dir(), exist_ok=True)
+    _write_json(os.path.join(_metrics_dir(), f"{os.getpid()}.json"), _snapshot())
+
+
+def _write_loop():
+    while True:
+        sleep(Settings.METRICS_FLUSH_INTERVAL)
+
+        try:
+            write_snapshot()
+        except Exception as e:
+            Log.error(f"Failed to write metrics snapshot: {e}")
+
+
+def _is_running(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+    return True
+
+
+def _merge(totals, snapshot, keep_gauges=True):
+    for name, labels, value in snapshot["counters"]:
+        key = (name, tuple(map(tuple, labels)))
+        totals["counters"][key] = totals["counters"].get(key, 0) + value
+
+    for name, labels, values in snapshot["histograms"]:
+        key = (name, tuple(map(tuple, labels)))
+        merged = totals["histograms"].setdefault(key, [0] * len(values))
+
+        for index, value in enumerate(values):
+            merged[index] += value
+
+    if keep_gauges:
+        for name, labels, value in snapshot["gauges"]:
+            key = (name, tuple(map(tuple, labels)))
+            totals["gauges"][key] = totals["gauges"].get(key, 0) + value
+
+
+def _empty_totals():
+    return {"counters": {}, "histograms": {}, "gauges": {}}
+
+
+def _as_snapshot(totals):
+    return {
+        kind: [[name, labels, value] for (name, labels), value in series.items()]
+        for kind, series in totals.items()
+    }
+
+
+def collect_metrics():
+    """
+    Returns the metrics of every worker process added up.
+
+    Snapshots of processes that are not running anymore are folded into the
+    archive first, without their gauges.
+
+    Returns:
+        dict: {"counters", "histograms", "gauges"}, each {(name, labels): value}.
+    """
+    _ensure_writer_thread()
+    write_snapshot()
+
+    metrics_dir = _metrics_dir()
+    archive_path = os.path.join(metrics_dir, ARCHIVE_FILE)
+    with open(os.path.join(metrics_dir, ".lock"), "a") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+        archive = _read_json(archive_path) or _as_snapshot(_empty_totals())
+        snapshots = [archive]
+        exited = []
+
+        for path in glob(os.path.join(metrics_dir, "*.json")):
+            pid = os.path.basename(path)[: -len(".json")]
+
+            if not pid.isdigit():
+                continue
+
+            snapshot = _read_json(path)
+
+            if snapshot is None:
+                continue
+
+            if _is_running(int(pid)):
+                snapshots.append(snapshot)
+            else:
+                exited.append((path, snapshot))
+
+        if exited:
+            totals = _empty_totals()
+            _merge(totals, archive, keep_gauges=False)
+
+            for _, snapshot in exited:
+                _merge(totals, snapshot, keep_gauges=False)
+
+            archive = _as_snapshot(totals)
+            _write_json(archive_path, archive)
+            snapshots[0] = archive
+
+            for path, _ in exited:
+                os.remove(path)
+
+    totals = _empty_totals()
+
+    for snapshot in snapshots:
+        _merge(totals, snapshot)
+
+    return totals
+
+
+def _format_labels(labels, extra=()):
+    pairs = [*labels, *extra]
+
+    if not pairs:
+        return ""
+
+    escaped = (
+        (
+            label,
+            str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for label, value in pairs
+    )
+
+    return "{" + ",".join(f'{label}="{value}"' for label, value in escaped) + "}"
+
+
+def render_metrics(totals):
+    """
+    Returns metrics in the Prometheus text exposition format.
+
+    Parameters:
+        totals (dict): The metrics returned by collect_metrics().
+
+    Returns:
+        str: The metrics, one sample per line.
+    """
+    series = {}
+
+    for kind in ("counters", "histograms", "gauges"):
+        for (name, labels), value in totals[kind].items():
+            series.setdefault(name, []).append((labels, value))
+
+    lines = []
+
+    for name, (metric_type, help_text) in METRICS.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+
+        for labels, value in sorted(series.get(name, [])):
+            if metric_type != "histogram":
+                lines.append(f"{name}{_format_labels(labels)} {value}")
+                continue
+
+            cumulative = 0
+
+            for bound, count in zip((*DURATION_BUCKETS, "+Inf"), value[:-1]):
+                cumulative += count
+                lines.append(
+                    f"{name}_bucket{_format_labels(labels, (('le', bound),))} "
+                    f"{cumulative}"
+                )
+
+            lines.append(f"{name}_sum{_format_labels(labels)} {value[-1]}")
+            lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+
+    return "\n".join(lines) + "\n"
+
+
+def _write_final_snapshot():
+    if Settings.METRICS and _pid == os.getpid():
+        try:
+            write_snapshot()
+        except Exception as e:
+            Log.error(f"Failed to write metrics snapshot: {e}")
+
+
+atexit.register(_write_final_snapshot)
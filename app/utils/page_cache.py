@@ -0,0 +1,181 @@
+"""
+This module contains the full page cache for logged out visitors.
+
+Pages decorated with cache_page are rendered once per path, query string,
+language and theme and served from memory for PAGE_CACHE_TTL seconds to
+every visitor that is not logged in. The cache holds at most
+PAGE_CACHE_MAX_ENTRIES pages and evicts the least recently used one.
+
+Writes that change what a cached page shows call invalidate_page_cache() or
+invalidate_post_pages(). Each process has its own cache and only drops its
+own entries, so other processes serve their copy until it expires.
+"""
+
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+from time import monotonic
+
+from flask import g, make_response, request, session
+from flask_wtf.csrf import generate_csrf
+
+from settings import Settings
+from utils.log import Log
+from utils.view_counter import record_view
+
+# Cached pages embed the CSRF token of the visitor they were rendered for,
+# it is swapped for the token of the visitor they are served to.
+CSRF_PLACEHOLDER = b"\x00csrf-token\x00"
+
+# Response headers kept with a cached page.
+CACHED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Cache-Control")
+
+_pages = OrderedDict()
+_lock = Lock()
+_stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+# Bumped by every invalidation, pages rendered across one are not stored.
+_generation = 0
+
+
+def _is_cacheable_request():
+    return (
+        Settings.PAGE_CACHE_TTL > 0
+        and request.method in ("GET", "HEAD")
+        and "username" not in session
+        and not session.get("_flashes")
+    )
+
+
+def _cache_key():
+    return (
+        request.host,
+        request.path,
+        request.query_string,
+        session.get("language", "en"),
+        session.get("theme", "winter"),
+    )
+
+
+def mark_post_page(post_id):
+    """
+    Marks the page being rendered as the page of a post, so that
+    invalidate_post_pages() drops it and cached hits still count a view.
+    """
+    g.page_cache_post_id = post_id
+
+
+def cache_page(view):
+    """
+    Serves the decorated view from the page cache to logged out visitors.
+    """
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if not _is_cacheable_request():
+            return view(*args, **kwargs)
+
+        key = _cache_key()
+        now = monotonic()
+
+        with _lock:
+            generation = _generation
+            entry = _pages.get(key)
+            if entry and entry["expires"] > now:
+                _pages.move_to_end(key)
+                _stats["hits"] += 1
+            else:
+                entry = None
+                _stats["misses"] += 1
+
+        if entry:
+            body = entry["body"]
+            if CSRF_PLACEHOLDER in body:
+                body = body.replace(CSRF_PLACEHOLDER, generate_csrf().encode())
+
+            if entry["post_id"] is not None:
+                record_view(entry["post_id"])
+
+            response = make_response(body, entry["status"])
+            response.headers.update(entry["headers"])
+            response.headers["X-Cache"] = "HIT"
+            return response.make_conditional(request)
+
+        response = make_response(view(*args, **kwargs))
+
+        if response.status_code == 200 and not response.direct_passthrough:
+            body = response.get_data()
+            csrf_token = g.get("csrf_token")
+            if csrf_token:
+                body = body.replace(csrf_token.encode(), CSRF_PLACEHOLDER)
+
+            _store(
+                key,
+                generation,
+                {
+                    "expires": now + Settings.PAGE_CACHE_TTL,
+                    "status": response.status_code,
+                    "headers": [
+                        (name, response.headers[name])
+                        for name in CACHED_HEADERS
+                        if name in response.headers
+                    ],
+                    "body": body,
+                    "post_id": g.get("page_cache_post_id"),
+                },
+            )
+
+        response.headers["X-Cache"] = "MISS"
+        return response
+
+    return wrapper
+
+
+def _store(key, generation, entry):
+    with _lock:
+        if generation != _generation:
+            return
+
+        _pages[key] = entry
+        _pages.move_to_end(key)
+
+        while len(_pages) > Settings.PAGE_CACHE_MAX_ENTRIES:
+            _pages.popitem(last=False)
+            _stats["evictions"] += 1
+
+
+def invalidate_page_cache():
+    """
+    Drops every cached page.
+    """
+    global _generation
+
+    with _lock:
+        _pages.clear()
+        _generation += 1
+        _stats["invalidations"] += 1
+
+    Log.info("Page cache cleared")
+
+
+def invalidate_post_pages(post_id):
+    """
+    Drops the cached pages of a post.
+    """
+    global _generation
+
+    with _lock:
+        for key in [
+            key for key, entry in _pages.items() if entry["post_id"] == post_id
+        ]:
+            del _pages[key]
+        _generation += 1
+        _stats["invalidations"] += 1
+
+
+def page_cache_stats():
+    """
+    Returns the hit, miss, eviction and invalidation counters of the page
+    cache and its current size.
+    """
+    with _lock:
+        return {**_stats, "size": len(_pages)}
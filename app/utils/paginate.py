@@ -1,25 +1,185 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from json import dumps, loads
+from math import ceil
+
 from flask import request
+from sqlalchemy import Select, func, literal, tuple_
 
+from database import db
+from utils.count_cache import count_rows, get_count
 from utils.log import Log
 
 
-def paginate_query(query, per_page=12):
+def paginate_query(query, per_page=12, count_key=None):
     """Return paginated data for a SQLAlchemy query.
 
     Args:
         query: SQLAlchemy query object.
         per_page: Number of items per page.
+        count_key: Count cache key of the query, see utils.count_cache. The
+            query is counted on every call when it is None.
 
     Returns:
         tuple: (items, page, total_pages)
     """
     page = request.args.get("page", 1, type=int)
 
-    Log.info(f"Paginating query, page {page}, per_page {per_page}")
+    Log.info("Paginating query, page %s, per_page %s", page, per_page)
 
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    pagination = query.paginate(
+        page=page, per_page=per_page, error_out=False, count=False
+    )
 
     items = pagination.items
-    total_pages = max(pagination.pages, 1)
+    total_pages = max(count_pages(query, per_page, count_key), 1)
 
     return items, page, total_pages
+
+
+def paginate_query_by_cursor(
+    query, sort_column, id_column, descending=True, per_page=12, count_key=None
+):
+    """Return keyset paginated data for a SQLAlchemy query.
+
+    Instead of skipping rows with OFFSET, each page starts right after the
+    (sort_column, id_column) key of the last row of the page before it, so
+    deep pages cost the same as the first one. Pages are addressed with the
+    opaque tokens in the returned cursors, passed back in the "cursor" query
+    argument. A plain "page" argument still works and falls back to OFFSET.
+
+    A NULL never matches a keyset comparison, so a nullable sort_column is
+    ordered and compared as coalesce(sort_column, 0) instead, which sorts
+    NULLs with 0. Nullable sort columns must be numeric and need an index on
+    that expression to keep deep pages cheap.
+
+    Args:
+        query: SQLAlchemy query object or Core select, without an order_by.
+        sort_column: Column the listing is sorted by.
+        id_column: Unique column used to break ties in sort_column.
+        descending: Sort direction of the listing.
+        per_page: Number of items per page.
+        count_key: Count cache key of the query, see utils.count_cache. The
+            query is counted on every call when it is None.
+
+    Returns:
+        tuple: (items, page, total_pages, cursors) where cursors is a dict
+        with the "previous" and "next" page tokens, None when there is no
+        such page.
+    """
+    total_pages = max(count_pages(query, per_page, count_key), 1)
+    cursor = decode_cursor(request.args.get("cursor"))
+
+    if cursor:
+        page, direction, sort_value, id_value = cursor
+    else:
+        page = max(request.args.get("page", 1, type=int), 1)
+        direction = "next"
+
+    Log.info("Paginating query by cursor, page %s, per_page %s", page, per_page)
+
+    forward = direction == "next"
+    newest_first = descending == forward
+    nullable = getattr(sort_column, "nullable", False)
+    sort_key = func.coalesce(sort_column, 0) if nullable else sort_column
+
+    if newest_first:
+        query = query.order_by(sort_key.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_key.asc(), id_column.asc())
+
+    if cursor:
+        key = tuple_(sort_key, id_column)
+        bound = tuple_(literal(sort_value), literal(id_value))
+
+        # The single column bound is redundant, it lets the query planner
+        # seek the expression index instead of scanning it.
+        if newest_first:
+            query = query.filter(sort_key <= sort_value, key < bound)
+        else:
+            query = query.filter(sort_key >= sort_value, key > bound)
+    else:
+        query = query.offset((page - 1) * per_page)
+
+    items = fetch_all(query.limit(per_page + 1))
+    has_more = len(items) > per_page
+    items = items[:per_page]
+
+    if not forward:
+        items.reverse()
+
+    cursors = {"previous": None, "next": None}
+
+    def row_sort_value(row):
+        value = getattr(row, sort_column.key)
+        return 0 if value is None and nullable else value
+
+    if items:
+        first, last = items[0], items[-1]
+
+        if page > 1:
+            cursors["previous"] = encode_cursor(
+                page - 1,
+                "previous",
+                row_sort_value(first),
+                getattr(first, id_column.key),
+            )
+
+        if has_more or not forward:
+            cursors["next"] = encode_cursor(
+                page + 1,
+                "next",
+                row_sort_value(last),
+                getattr(last, id_column.key),
+            )
+
+    return items, page, total_pages, cursors
+
+
+def fetch_all(query):
+    """Return the rows of a SQLAlchemy query or Core select."""
+    if isinstance(query, Select):
+        return db.session.execute(query).all()
+
+    return query.all()
+
+
+def count_pages(query, per_page, count_key=None):
+    """Return the number of pages the rows of a query fill."""
+    if count_key is None:
+        total = count_rows(query)
+    else:
+        total = get_count(count_key, query)
+
+    return ceil(total / per_page)
+
+
+def encode_cursor(page, direction, sort_value, id_value):
+    """Return an opaque, URL safe page token."""
+    payload = dumps([page, direction, sort_value, id_value], separators=(",", ":"))
+    return urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token):
+    """Return the (page, direction, sort_value, id_value) of a page token.
+
+    Returns None when the token is missing or malformed.
+    """
+    if not token:
+        return None
+
+    try:
+        payload = urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        page, direction, sort_value, id_value = loads(payload)
+    except (ValueError, TypeError):
+        return None
+
+    if (
+        not isinstance(page, int)
+        or page < 1
+        or direction not in ("previous", "next")
+        or isinstance(sort_value, (list, dict))
+        or isinstance(id_value, (list, dict))
+    ):
+        return None
+
+    return page, direction, sort_value, id_value
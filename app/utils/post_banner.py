@@ -0,0 +1,112 @@
+"""
+This module contains the helpers for post banner images.
+
+Every banner is stored as a file named after the SHA-256 hash of its bytes,
+see utils/banner_storage.py, and its post records the hash and the mimetype
+sniffed from its leading bytes. The hash is part of the banner URL, so a
+banner URL always points at the same bytes and can be cached for good.
+Resized and re-encoded variants are made by utils/banner_processor.py.
+"""
+
+from hashlib import sha256
+
+from flask import url_for
+
+from models import PostBanner
+from utils.banner_storage import banner_file_name, write_banner_file
+
+# Leading bytes of the image formats browsers display, and their mimetypes.
+IMAGE_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"BM", "image/bmp"),
+    (b"\x00\x00\x01\x00", "image/x-icon"),
+)
+
+
+def sniff_mimetype(image):
+    """
+    Returns the mimetype of an image from its leading bytes.
+
+    Parameters:
+        image (bytes): The image.
+
+    Returns:
+        str: The mimetype, application/octet-stream when the format is unknown.
+    """
+    for signature, mimetype in IMAGE_SIGNATURES:
+        if image.startswith(signature):
+            return mimetype
+
+    if image[:4] == b"RIFF" and image[8:12] == b"WEBP":
+        return "image/webp"
+
+    if image[4:8] == b"ftyp" and image[8:12] in (b"avif", b"avis"):
+        return "image/avif"
+
+    return "application/octet-stream"
+
+
+def hash_banner(image):
+    """
+    Returns the hex SHA-256 hash of a banner image.
+    """
+    return sha256(image).hexdigest()
+
+
+def store_banner(image):
+    """
+    Writes an uploaded image to the banner storage, unless an identical
+    image is already stored.
+
+    Parameters:
+        image (bytes): The uploaded image.
+
+    Returns:
+        str: The hash of the image.
+    """
+    banner_hash = hash_banner(image)
+    write_banner_file(banner_file_name(banner_hash), image)
+    return banner_hash
+
+
+def set_post_banner(post, image):
+    """
+    Stores an uploaded image as the banner of a post, with its hash and mimetype.
+
+    Parameters:
+        post (Post): The post, committed by the caller.
+        image (bytes): The uploaded image.
+
+    Returns:
+        None
+    """
+    if post.banner is None:
+        post.banner = PostBanner()
+
+    post.banner.hash = store_banner(image)
+    post.banner.mimetype = sniff_mimetype(image)
+
+
+def post_banner_url(post_id, banner_hash=None, variant=None, image_format=None):
+    """
+    Returns the URL of a post's banner, including its content hash when known.
+
+    Parameters:
+        post_id (int): The ID of the post.
+        banner_hash (str, optional): The content hash of the banner.
+        variant (str, optional): card, hero or original, original when omitted.
+        image_format (str, optional): avif or webp, the JPEG or PNG fallback when omitted.
+
+    Returns:
+        str: The URL of the banner.
+    """
+    return url_for(
+        "return_post_banner.return_post_banner",
+        post_id=post_id,
+        banner_hash=banner_hash,
+        variant=variant,
+        format=image_format,
+    )
@@ -0,0 +1,59 @@
+"""
+This module contains the read path for post cards.
+
+Post listings only need a handful of short columns per post. Selecting them
+with a Core select skips the post content and the ORM identity map, and each
+row is kept as a compact PostCard tuple.
+"""
+
+from typing import NamedTuple
+
+from sqlalchemy import select
+
+from database import db
+from models import Post, PostBanner
+
+
+class PostCard(NamedTuple):
+    """
+    The columns of a post that components/post_card_macro.html and the
+    listing sort options need.
+    """
+
+    id: int
+    title: str
+    abstract: str
+    author: str
+    category: str
+    url_id: str
+    slug: str
+    views: int
+    time_stamp: int
+    last_edit_time_stamp: int
+    hot_score: float
+    banner_hash: str
+
+
+def select_post_cards():
+    """
+    Returns a Core select of the PostCard columns of every post.
+    """
+    columns = Post.__table__.c
+    return select(
+        *(columns[field] for field in PostCard._fields[:-1]),
+        PostBanner.hash.label("banner_hash"),
+    ).outerjoin(PostBanner, PostBanner.post_id == Post.id)
+
+
+def to_post_cards(rows):
+    """
+    Returns the rows of a select_post_cards() select as PostCard tuples.
+    """
+    return [PostCard._make(row) for row in rows]
+
+
+def get_post_cards(statement):
+    """
+    Executes a select_post_cards() select and returns its rows as PostCard tuples.
+    """
+    return to_post_cards(db.session.execute(statement))
@@ -0,0 +1,199 @@
+"""
+This module contains the stored HTML of post content.
+
+Posts are rendered from markdown and sanitized once, when they are created or
+edited, and the HTML is stored in posts.content_html together with the
+RENDERER_VERSION it was rendered with. Post pages serve the stored HTML. Rows
+rendered by an older renderer configuration are rendered on the fly until
+scripts/render_post_html.py re-renders them.
+
+Post lists show an excerpt instead. Only the first EXCERPT_LENGTH characters
+of the content are read from the database, cut at a block boundary and
+rendered, so a list costs the same for short notes and long articles.
+"""
+
+import re
+
+from markupsafe import Markup
+from sqlalchemy import bindparam, func, or_, select, update
+
+from database import db
+from models import Post, PostBanner
+from utils.log import Log
+from utils.markdown_renderer import RENDERER_VERSION, render_markdown
+
+EXCERPT_LENGTH = 600
+
+# A code fence line, the fence is closed by a line of at least as many of the
+# same character and nothing else.
+CODE_FENCE = re.compile(r" {0,3}(`{3,}|~{3,})")
+
+
+def render_post_html(post):
+    """
+    Renders the content of a post and stores the HTML on it.
+
+    Parameters:
+        post (Post): The post whose content is rendered, committed by the caller.
+
+    Returns:
+        None
+    """
+    post.content_html = str(render_markdown(post.content))
+    post.content_html_version = RENDERER_VERSION
+
+
+def get_post_html(post):
+    """
+    Returns the sanitized HTML of a post's content.
+
+    Parameters:
+        post (Post): The post whose content is returned.
+
+    Returns:
+        Markup: The stored HTML, or freshly rendered HTML when it is missing or stale.
+    """
+    if post.content_html is not None and post.content_html_version == RENDERER_VERSION:
+        return Markup(post.content_html)
+
+    Log.warning(f"Post {post.id} has no up to date stored HTML, rendering it")
+
+    return render_markdown(post.content)
+
+
+def rerender_stale_posts(batch_size=100):
+    """
+    Re-renders and stores the HTML of every post that has none, or that was
+    rendered with another RENDERER_VERSION.
+
+    Parameters:
+        batch_size (int): Number of posts rendered and committed at a time.
+
+    Returns:
+        int: The number of posts re-rendered.
+    """
+    table = Post.__table__
+    stale = or_(
+        table.c.content_html_version.is_(None),
+        table.c.content_html_version != RENDERER_VERSION,
+    )
+    last_id = 0
+    rendered = 0
+
+    while True:
+        rows = db.session.execute(
+            select(table.c.id, table.c.content)
+            .where(stale, table.c.id > last_id)
+            .order_by(table.c.id)
+            .limit(batch_size)
+        ).all()
+
+        if not rows:
+            break
+
+        db.session.execute(
+            update(table)
+            .where(table.c.id == bindparam("post_id"))
+            .values(
+                content_html=bindparam("html"), content_html_version=RENDERER_VERSION
+            ),
+            [
+                {"post_id": post_id, "html": str(render_markdown(content))}
+                for post_id, content in rows
+            ],
+        )
+        db.session.commit()
+
+        last_id = rows[-1].id
+        rendered += len(rows)
+
+    Log.info(f"Re-rendered the stored HTML of {rendered} posts")
+
+    return rendered
+
+
+def cut_excerpt(text, max_length=EXCERPT_LENGTH):
+    """
+    Returns the leading markdown blocks of a text that fit in max_length
+    characters, or the text itself when it is short enough.
+
+    The cut is made at the last blank line that is not inside a fenced code
+    block. Text without such a line is cut at the last whitespace instead, or
+    at the last line break when it opens with a code block, which is closed
+    with the fence it was opened with.
+    """
+    if len(text) <= max_length:
+        return text
+
+    head = text[:max_length]
+    cut = -1
+    fence = None
+    offset = 0
+
+    for line in head.splitlines(keepends=True):
+        match = CODE_FENCE.match(line)
+
+        if match and fence is None:
+            fence = match.group(1)
+            fence_start = offset
+        elif (
+            match
+            and match.group(1)[0] == fence[0]
+            and len(match.group(1)) >= len(fence)
+            and not line[match.end() :].strip()
+        ):
+            fence = None
+        elif not line.strip() and fence is None:
+            cut = offset
+        offset += len(line)
+
+    if fence is not None and fence_start > 0:
+        cut = max(cut, fence_start)
+
+    if cut > 0:
+        return head[:cut].rstrip()
+
+    if fence is not None:
+        return head.rsplit("\n", 1)[0] + "\n" + fence
+
+    return head.rsplit(None, 1)[0] + "…"
+
+
+def render_excerpt(text):
+    """
+    Returns the sanitized HTML of the leading blocks of a post's content.
+    """
+    return render_markdown(cut_excerpt(text or ""))
+
+
+def select_post_excerpts():
+    """
+    Returns a Core select of every post for the dashboard and admin post
+    lists. The content column holds only the first EXCERPT_LENGTH + 1
+    characters, enough for cut_excerpt() to tell whether it was truncated.
+
+    Rows are (id, title, tags, content, author, views, time_stamp,
+    last_edit_time_stamp, category, url_id, abstract, banner_hash).
+    """
+    return select(
+        Post.id,
+        Post.title,
+        Post.tags,
+        func.substr(Post.content, 1, EXCERPT_LENGTH + 1).label("content"),
+        Post.author,
+        Post.views,
+        Post.time_stamp,
+        Post.last_edit_time_stamp,
+        Post.category,
+        Post.url_id,
+        Post.abstract,
+        PostBanner.hash.label("banner_hash"),
+    ).outerjoin(PostBanner, PostBanner.post_id == Post.id)
+
+
+def to_post_excerpt_rows(rows):
+    """
+    Returns select_post_excerpts() rows as lists with the rendered excerpt
+    appended.
+    """
+    return [[*row, render_excerpt(row.content)] for row in rows]
@@ -0,0 +1,190 @@
+"""
+This module contains the full text search over posts.
+
+On SQLite, posts are indexed in the posts_fts FTS5 table over their title,
+tags, abstract, content and author. The table stores no copy of the text, it
+reads it back from posts, and triggers on posts keep it in sync with every
+insert, delete and edit. Results are ranked with BM25 and paginated in SQL.
+
+Chinese and Japanese text is written without spaces between words, which
+the unicode61 tokenizer can't split, so queries in those scripts and every
+query on other databases fall back to ILIKE substring matching of the
+title, tags and author, ordered by creation time.
+"""
+
+import re
+from math import ceil
+
+from sqlalchemy import column, func, literal_column, or_, select, table, text
+
+from database import db
+from models import Post
+from utils.log import Log
+from utils.post_cards import get_post_cards, select_post_cards
+
+SEARCH_TABLE = "posts_fts"
+
+# BM25 weights of the indexed columns, in the order they are declared.
+SEARCH_WEIGHTS = {
+    "title": 10.0,
+    "tags": 5.0,
+    "abstract": 3.0,
+    "content": 1.0,
+    "author": 5.0,
+}
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+# Han ideographs, hiragana and katakana.
+_UNSEGMENTED_PATTERN = re.compile(
+    "[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]"
+)
+
+
+def create_post_search_index():
+    """
+    Creates the posts_fts table and its sync triggers if they do not exist,
+    and indexes the existing posts when the table is new.
+    """
+    if db.engine.dialect.name != "sqlite":
+        Log.info("Full text search index skipped, database is not SQLite")
+        return
+
+    columns = ", ".join(SEARCH_WEIGHTS)
+    new_columns = ", ".join(f"new.{name}" for name in SEARCH_WEIGHTS)
+    old_columns = ", ".join(f"old.{name}" for name in SEARCH_WEIGHTS)
+
+    exists = db.session.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": SEARCH_TABLE},
+    ).first()
+
+    statements = [
+        (
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+            f"{columns}, content='posts', content_rowid='id', "
+            "tokenize='unicode61 remove_diacritics 2')"
+        ),
+        (
+            f"CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_insert AFTER INSERT ON posts "
+            f"BEGIN INSERT INTO {SEARCH_TABLE}(rowid, {columns}) "
+            f"VALUES (new.id, {new_columns}); END"
+        ),
+        (
+            f"CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_delete AFTER DELETE ON posts "
+            f"BEGIN INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, {columns}) "
+            f"VALUES ('delete', old.id, {old_columns}); END"
+        ),
+        # Only edits of indexed columns touch the index, so view count and
+        # hot score updates stay cheap.
+        (
+            f"CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_update "
+            f"AFTER UPDATE OF {columns} ON posts "
+            f"BEGIN INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, {columns}) "
+            f"VALUES ('delete', old.id, {old_columns}); "
+            f"INSERT INTO {SEARCH_TABLE}(rowid, {columns}) "
+            f"VALUES (new.id, {new_columns}); END"
+        ),
+    ]
+
+    for statement in statements:
+        db.session.execute(text(statement))
+
+    if not exists:
+        db.session.execute(
+            text(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')")
+        )
+        Log.success("Full text search index created")
+
+    db.session.commit()
+
+
+def build_match_query(query):
+    """
+    Returns an FTS5 MATCH expression for a user search query, or None when the
+    query has no words.
+
+    Every word is matched as a prefix and all of them must match. A query of
+    several words also matches them written together, so "flask blog" finds
+    the tag "flaskblog".
+    """
+    words = _WORD_PATTERN.findall(query.lower())
+
+    if not words:
+        return None
+
+    match_query = " AND ".join(f'"{word}"*' for word in words)
+
+    if len(words) > 1:
+        match_query = f'({match_query}) OR "{"".join(words)}"*'
+
+    return match_query
+
+
+def search_posts(query, page=1, per_page=9):
+    """
+    Returns one page of the posts matching a search query, best match first.
+
+    Parameters:
+        query (str): The search query.
+        page (int): The page number, starting at 1.
+        per_page (int): Number of posts per page.
+
+    Returns:
+        tuple: (posts, total_pages) where posts is a list of PostCard tuples.
+    """
+    if db.engine.dialect.name != "sqlite" or _UNSEGMENTED_PATTERN.search(query):
+        return _search_posts_by_pattern(query, page, per_page)
+
+    match_query = build_match_query(query)
+
+    if match_query is None:
+        return [], 1
+
+    search_table = table(SEARCH_TABLE, column("rowid"))
+    # The hidden column named after an FTS5 table matches against all columns.
+    search_column = literal_column(SEARCH_TABLE)
+    matches = search_column.op("MATCH")(match_query)
+
+    total = db.session.scalar(
+        select(func.count()).select_from(search_table).where(matches)
+    )
+
+    posts = get_post_cards(
+        select_post_cards()
+        .join(search_table, search_table.c.rowid == Post.id)
+        .where(matches)
+        .order_by(func.bm25(search_column, *SEARCH_WEIGHTS.values()), Post.id.desc())
+        .limit(per_page)
+        .offset((page - 1) * per_page)
+    )
+
+    Log.info(f'Full text search for "{match_query}" matched {total} posts')
+
+    return posts, max(ceil(total / per_page), 1)
+
+
+def _search_posts_by_pattern(query, page, per_page):
+    """
+    Returns one page of the posts whose title, tags or author contain the query.
+    """
+    patterns = {f"%{query}%", f"%{query.replace(' ', '')}%"}
+    condition = or_(
+        *(
+            post_column.ilike(pattern)
+            for pattern in patterns
+            for post_column in (Post.title, Post.tags, Post.author)
+        )
+    )
+
+    total = db.session.scalar(select(func.count(Post.id)).where(condition))
+
+    posts = get_post_cards(
+        select_post_cards()
+        .where(condition)
+        .order_by(func.coalesce(Post.time_stamp, 0).desc(), Post.id.desc())
+        .limit(per_page)
+        .offset((page - 1) * per_page)
+    )
+
+    return posts, max(ceil(total / per_page), 1)
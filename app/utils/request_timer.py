@@ -0,0 +1,97 @@
+"""
+This module contains the per request timer.
+
+A request's wall time is measured from the first before_request hook to the
+after_request hook. SQL statements and render_template calls made while the
+request is handled add their time to the request's DB and template time, so
+the access log can tell a slow query from a slow template. Template time
+includes the queries run while the template renders.
+"""
+
+from time import perf_counter
+
+from flask import before_render_template, g, has_request_context, template_rendered
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+def start_request_timer():
+    """
+    Starts timing the current request.
+    """
+    g.request_started = perf_counter()
+    g.request_timings = {"db_time": 0.0, "db_queries": 0, "template_time": 0.0}
+    g.template_starts = []
+
+
+def request_timings():
+    """
+    Returns the timings of the current request, in milliseconds.
+
+    Returns:
+        dict: latency_ms, db_ms, db_queries and template_ms, or an empty dict
+        when the request was not timed.
+    """
+    started = g.get("request_started")
+
+    if started is None:
+        return {}
+
+    timings = g.request_timings
+
+    return {
+        "latency_ms": round((perf_counter() - started) * 1000, 2),
+        "db_ms": round(timings["db_time"] * 1000, 2),
+        "db_queries": timings["db_queries"],
+        "template_ms": round(timings["template_time"] * 1000, 2),
+    }
+
+
+def _timed_request():
+    return has_request_context() and "request_timings" in g
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context.query_started = perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "query_started", None)
+
+    if started is not None and _timed_request():
+        g.request_timings["db_time"] += perf_counter() - started
+        g.request_timings["db_queries"] += 1
+
+
+def _before_render_template(sender, template, context, **extra):
+    if _timed_request():
+        g.template_starts.append(perf_counter())
+
+
+def _template_rendered(sender, template, context, **extra):
+    if _timed_request() and g.template_starts:
+        started = g.template_starts.pop()
+
+        # Templates rendered inside another one are counted with the outer one.
+        if not g.template_starts:
+            g.request_timings["template_time"] += perf_counter() - started
+
+
+def init_request_timer(app):
+    """
+    Times every request of the app and the SQL statements and templates it runs.
+
+    Parameters:
+        app (Flask): The application whose requests are timed.
+
+    Returns:
+        None
+    """
+    app.before_request(start_request_timer)
+
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+    before_render_template.connect(_before_render_template, app)
+    template_rendered.connect(_template_rendered, app)
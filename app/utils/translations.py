@@ -1,8 +1,120 @@
+"""
+This module contains the translation catalog.
+
+Every translations/*.json file is parsed once, validated against the English
+file and kept as an immutable per-language map. Pages read the catalog
+instead of opening the files on every request. reload_translations() swaps
+in a freshly loaded catalog, and install_reload_signal() runs it on SIGHUP
+when TRANSLATIONS_RELOAD_ON_SIGHUP is enabled.
+"""
+
+import signal
 from json import load
-from os.path import exists
+from os import listdir
+from os.path import abspath, dirname, join
+from threading import Lock
+from types import MappingProxyType
 
 from utils.log import Log
 
+TRANSLATIONS_DIR = join(dirname(dirname(abspath(__file__))), "translations")
+REFERENCE_LANGUAGE = "en"
+
+_catalog = None
+_lock = Lock()
+
+
+def _freeze(value):
+    """
+    Returns a read only copy of a parsed JSON value.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _key_paths(value, prefix=""):
+    """
+    Returns the dotted paths of every key in a nested translation map.
+    """
+    paths = set()
+    for key, item in value.items():
+        path = f"{prefix}{key}"
+        paths.add(path)
+        if isinstance(item, dict):
+            paths |= _key_paths(item, f"{path}.")
+    return paths
+
+
+def _load_catalog():
+    """
+    Parses and validates every translation file.
+
+    Returns:
+        MappingProxyType: The translations of each language, keyed by language code.
+    """
+    translations = {}
+
+    for file_name in sorted(listdir(TRANSLATIONS_DIR)):
+        if not file_name.endswith(".json"):
+            continue
+
+        language = file_name.removesuffix(".json")
+
+        with open(join(TRANSLATIONS_DIR, file_name), "r", encoding="utf-8") as file:
+            data = load(file)
+
+        if not isinstance(data, dict):
+            raise TypeError(f"Translation file {file_name} is not a JSON object")
+
+        translations[language] = data
+
+    reference = translations.get(REFERENCE_LANGUAGE)
+
+    if reference is not None:
+        reference_paths = _key_paths(reference)
+        for language, data in translations.items():
+            missing = reference_paths - _key_paths(data)
+            if missing:
+                Log.warning(
+                    f"Translations for {language} are missing {len(missing)} keys: "
+                    f"{', '.join(sorted(missing)[:5])}"
+                )
+
+    Log.info(f"Loaded translations for languages: {', '.join(translations)}")
+
+    return MappingProxyType(
+        {language: _freeze(data) for language, data in translations.items()}
+    )
+
+
+def reload_translations():
+    """
+    Reloads the translation catalog from disk.
+
+    Returns:
+        None
+    """
+    global _catalog
+
+    _catalog = _load_catalog()
+
+
+def get_catalog():
+    """
+    Returns the translation catalog, loading it on first use.
+    """
+    global _catalog
+
+    if _catalog is None:
+        with _lock:
+            if _catalog is None:
+                _catalog = _load_catalog()
+
+    return _catalog
+
 
 def load_translations(language):
     """
@@ -12,14 +124,31 @@ def load_translations(language):
         language (str): The language code for the translations to be loaded.
 
     Returns:
-        dict: A dictionary containing the translations for the specified language.
+        Mapping: A read only mapping containing the translations for the specified language.
+    """
+    translations = get_catalog().get(language)
+
+    if translations is None:
+        Log.warning(f"Translation file not found: {language}")
+        return MappingProxyType({})
+
+    return translations
+
+
+def install_reload_signal():
     """
+    Reloads the translation catalog when the process receives SIGHUP.
+
+    Does nothing on platforms without SIGHUP or outside of the main thread.
+    """
+    if not hasattr(signal, "SIGHUP"):
+        return
+
+    def handle_reload(signum, frame):
+        Log.info("SIGHUP received, reloading translations")
+        reload_translations()
 
-    file = f"./translations/{language}.json"
-    if exists(file):
-        with open(file, "r", encoding="utf-8") as file:
-            translations = load(file)
-            Log.info(f"Loaded translations for language: {language}")
-            return translations
-    Log.warning(f"Translation file not found: {language}")
-    return {}
+    try:
+        signal.signal(signal.SIGHUP, handle_reload)
+    except ValueError:
+        Log.warning("Translation reload signal not installed outside of main thread")
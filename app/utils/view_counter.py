@@ -0,0 +1,122 @@
+"""
+This module contains the buffered post view counter.
+
+Page views are counted in memory and written to the database in batches with
+atomic "views = views + n" updates, so reading a post doesn't take the
+database write lock.
+"""
+
+import atexit
+from collections import Counter
+from threading import Lock, Thread
+from time import sleep
+
+from sqlalchemy import bindparam, func, update
+
+from database import db
+from models import Post
+from settings import Settings
+from utils.hot_score import refresh_hot_scores
+from utils.log import Log
+
+_pending_views = Counter()
+_lock = Lock()
+
+
+def record_view(post_id):
+    """
+    Counts a view of the post, it is written to the database on the next flush.
+    """
+    with _lock:
+        _pending_views[post_id] += 1
+
+
+def get_pending_views(post_id):
+    """
+    Returns the views of the post that are not written to the database yet.
+    """
+    with _lock:
+        return _pending_views[post_id]
+
+
+def flush_views():
+    """
+    Writes the buffered views to the database, then refreshes the hot scores
+    of the viewed posts. Views are put back into the buffer if the write fails,
+    a failed refresh is logged and doesn't undo the write.
+
+    Returns:
+        None
+    """
+    global _pending_views
+
+    with _lock:
+        pending_views, _pending_views = _pending_views, Counter()
+
+    if not pending_views:
+        return
+
+    table = Post.__table__
+
+    try:
+        db.session.execute(
+            update(table)
+            .where(table.c.id == bindparam("post_id"))
+            .values(views=func.coalesce(table.c.views, 0) + bindparam("view_count")),
+            [
+                {"post_id": post_id, "view_count": view_count}
+                for post_id, view_count in pending_views.items()
+            ],
+        )
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+
+        with _lock:
+            _pending_views.update(pending_views)
+
+        raise
+
+    Log.info(
+        f"Flushed {sum(pending_views.values())} views of {len(pending_views)} posts"
+    )
+
+    # The views are saved, a failed refresh only leaves the scores stale
+    # until the hot score refresher runs.
+    try:
+        refresh_hot_scores(list(pending_views))
+    except Exception as e:
+        db.session.rollback()
+        Log.error(f"Failed to refresh hot scores of viewed posts: {e}")
+
+
+def start_view_count_flusher(app):
+    """
+    Starts a daemon thread that flushes the buffered views every
+    VIEW_COUNT_FLUSH_INTERVAL seconds, and flushes them once more at exit.
+
+    Parameters:
+        app (Flask): The application whose database the views are written to.
+
+    Returns:
+        None
+    """
+
+    def flush():
+        with app.app_context():
+            try:
+                flush_views()
+            except Exception as e:
+                Log.error(f"Failed to flush post views: {e}")
+
+    def flush_loop():
+        while True:
+            sleep(Settings.VIEW_COUNT_FLUSH_INTERVAL)
+            flush()
+
+    Thread(target=flush_loop, name="view-count-flusher", daemon=True).start()
+    atexit.register(flush)
+
+    Log.info(
+        f"View count flusher started, interval: {Settings.VIEW_COUNT_FLUSH_INTERVAL}s"
+    )
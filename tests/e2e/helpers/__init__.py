@@ -2,13 +2,18 @@
 from tests.e2e.helpers.database_helpers import (
     reset_database,
     create_test_user,
+    create_test_post,
+    get_post_by_url_id,
     get_user_by_username,
 )
-from tests.e2e.helpers.test_data import UserData
+from tests.e2e.helpers.test_data import PostData, UserData
 
 __all__ = [
     "reset_database",
     "create_test_user",
+    "create_test_post",
+    "get_post_by_url_id",
     "get_user_by_username",
     "UserData",
+    "PostData",
 ]
@@ -3,9 +3,14 @@ Database helper functions for E2E tests.
 """
 
 import sqlite3
+import time
+import uuid
 
 from passlib.hash import sha512_crypt as encryption
 
+# Default time_stamp of create_test_post, None stores NULL instead.
+CURRENT_TIME = object()
+
 
 def get_db_connection(db_path: str):
     """Create a database connection."""
@@ -137,3 +142,69 @@ def get_user_points(db_path: str, username: str) -> int | None:
     if user:
         return user.get("points", 0)
     return None
+
+
+def create_test_post(
+    db_path: str,
+    title: str,
+    author: str,
+    category: str = "Other",
+    views: int | None = 0,
+    time_stamp: int | None | object = CURRENT_TIME,
+    last_edit_time_stamp: int | None = None,
+) -> str:
+    """
+    Create a post directly in the database, bypassing the app's caches.
+    NULL views, creation and edit times can be stored, like legacy rows have.
+    Returns the url_id of the created post.
+    """
+    conn = get_db_connection(db_path)
+    cursor = conn.cursor()
+
+    try:
+        url_id = uuid.uuid4().hex[:12]
+
+        cursor.execute(
+            """
+            INSERT INTO posts (title, tags, content, author, views, time_stamp,
+                last_edit_time_stamp, category, url_id, abstract)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                title,
+                "test",
+                "Test post content.",
+                author,
+                views,
+                int(time.time()) if time_stamp is CURRENT_TIME else time_stamp,
+                last_edit_time_stamp,
+                category,
+                url_id,
+                "Test post abstract.",
+            ),
+        )
+
+        conn.commit()
+        return url_id
+    finally:
+        conn.close()
+
+
+def get_post_by_url_id(db_path: str, url_id: str) -> dict | None:
+    """
+    Get post data by url_id.
+    Returns a dictionary with post fields or None if not found.
+    """
+    conn = get_db_connection(db_path)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("SELECT * FROM posts WHERE url_id = ?", (url_id,))
+        row = cursor.fetchone()
+
+        if row:
+            return dict(row)
+        return None
+    finally:
+        conn.close()
@@ -25,3 +25,19 @@ class UserData:
     def unverified(cls) -> "UserData":
         """Generate unverified user data."""
         return cls(is_verified="False")
+
+
+@dataclass
+class PostData:
+    """Test post data that passes the create post form validation."""
+
+    title: str = field(default_factory=lambda: f"Test post {uuid.uuid4().hex[:8]}")
+    tags: str = "test,e2e"
+    abstract: str = "An abstract written by the end to end tests. " * 4
+    content: str = "Content of a post created by the end to end tests. " * 2
+    category: str = "Other"
+
+    @classmethod
+    def generate(cls, **overrides) -> "PostData":
+        """Generate test post data with optional overrides."""
+        return cls(**overrides)
@@ -3,5 +3,16 @@ from tests.e2e.pages.base_page import BasePage
 from tests.e2e.pages.login_page import LoginPage
 from tests.e2e.pages.signup_page import SignupPage
 from tests.e2e.pages.navbar_component import NavbarComponent
+from tests.e2e.pages.post_list_page import PostListPage
+from tests.e2e.pages.create_post_page import CreatePostPage
+from tests.e2e.pages.post_page import PostPage
 
-__all__ = ["BasePage", "LoginPage", "SignupPage", "NavbarComponent"]
+__all__ = [
+    "BasePage",
+    "LoginPage",
+    "SignupPage",
+    "NavbarComponent",
+    "PostListPage",
+    "CreatePostPage",
+    "PostPage",
+]
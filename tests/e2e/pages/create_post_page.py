@@ -0,0 +1,38 @@
+"""
+Create Post Page Object for interacting with the create post form.
+"""
+
+from playwright.sync_api import Page
+
+from tests.e2e.helpers.test_data import PostData
+from tests.e2e.pages.base_page import BasePage
+
+
+class CreatePostPage(BasePage):
+    """Page object for the create post page."""
+
+    def __init__(self, page: Page, base_url: str):
+        super().__init__(page, base_url)
+
+        # Create post form selectors
+        self.title_input = 'input[name="post_title"]'
+        self.tags_input = 'input[name="post_tags"]'
+        self.abstract_input = 'textarea[name="post_abstract"]'
+        self.category_select = 'select[name="post_category"]'
+        self.content_input = "#markdown-editor"
+        self.submit_button = 'form button[type="submit"]'
+
+    def navigate(self, path: str = "/create-post"):
+        """Navigate to the create post page."""
+        return super().navigate(path)
+
+    def create_post(self, post: PostData):
+        """Fill in and submit the create post form."""
+        self.page.fill(self.title_input, post.title)
+        self.page.fill(self.tags_input, post.tags)
+        self.page.fill(self.abstract_input, post.abstract)
+        self.page.select_option(self.category_select, post.category)
+        self.page.fill(self.content_input, post.content)
+        self.page.click(self.submit_button)
+        self.page.wait_for_load_state("domcontentloaded")
+        return self
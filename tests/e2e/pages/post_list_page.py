@@ -0,0 +1,57 @@
+"""
+Post List Page Object for the home and category post listings.
+"""
+
+from playwright.sync_api import Page
+
+from tests.e2e.pages.base_page import BasePage
+
+
+class PostListPage(BasePage):
+    """Page object for paginated post listings."""
+
+    def __init__(self, page: Page, base_url: str):
+        super().__init__(page, base_url)
+
+        # Listing selectors
+        self.post_links = "a.card-title"
+        self.next_page_link = ".join a:has(.ti-chevron-right)"
+
+    def get_post_url_ids(self) -> list[str]:
+        """Get the url_ids of the posts on the current page, in order."""
+        hrefs = self.page.locator(self.post_links).evaluate_all(
+            "links => links.map(link => link.getAttribute('href'))"
+        )
+        return [href.rsplit("/", 1)[-1].rsplit("-", 1)[-1] for href in hrefs]
+
+    def get_post_path(self, title: str) -> str:
+        """Get the link of the post with the given title on the current page."""
+        return self.page.locator(self.post_links, has_text=title).first.get_attribute(
+            "href"
+        )
+
+    def has_next_page(self) -> bool:
+        """Check if the pagination bar links to a next page."""
+        return self.page.locator(self.next_page_link).count() > 0
+
+    def go_to_next_page(self):
+        """Follow the next page link."""
+        href = self.page.locator(self.next_page_link).get_attribute("href")
+        return self.navigate(href)
+
+    def collect_post_url_ids(self, path: str, max_pages: int = 100) -> list[str]:
+        """
+        Walk a listing from path through every next page link.
+        Returns the url_ids of all pages, in order, repeats included.
+        """
+        self.navigate(path)
+        url_ids = self.get_post_url_ids()
+
+        for _ in range(max_pages):
+            if not self.has_next_page():
+                return url_ids
+
+            self.go_to_next_page()
+            url_ids += self.get_post_url_ids()
+
+        raise AssertionError(f"{path} has more than {max_pages} pages")
@@ -0,0 +1,27 @@
+"""
+Post Page Object for reading a post and commenting on it.
+"""
+
+from playwright.sync_api import Page
+
+from tests.e2e.pages.base_page import BasePage
+
+
+class PostPage(BasePage):
+    """Page object for the post page."""
+
+    def __init__(self, page: Page, base_url: str):
+        super().__init__(page, base_url)
+
+        # Comment form selectors
+        self.comment_input = 'textarea[name="comment"]'
+        self.comment_submit_button = (
+            'form:has(textarea[name="comment"]) button[type="submit"]'
+        )
+
+    def add_comment(self, comment: str):
+        """Fill in and submit the comment form."""
+        self.page.fill(self.comment_input, comment)
+        self.page.click(self.comment_submit_button)
+        self.page.wait_for_load_state("domcontentloaded")
+        return self
@@ -0,0 +1 @@
+# Post Tests Package
@@ -0,0 +1,92 @@
+"""
+E2E tests for the page cache served to logged out visitors.
+"""
+
+import uuid
+
+import pytest
+
+from tests.e2e.helpers.test_data import PostData
+from tests.e2e.pages.create_post_page import CreatePostPage
+from tests.e2e.pages.post_list_page import PostListPage
+from tests.e2e.pages.post_page import PostPage
+
+LISTING_PATH = "/category/other"
+
+
+@pytest.fixture(scope="function")
+def visitor(browser_instance, flask_server):
+    """
+    Request context of a logged out visitor, separate from the page fixtures.
+    Requests go around the browser HTTP cache and keep the visitor's cookies.
+    """
+    context = browser_instance.new_context(base_url=flask_server["base_url"])
+    yield context.request
+    context.close()
+
+
+def _warm(visitor, path):
+    """Request path until it is served from the page cache."""
+    visitor.get(path)
+    response = visitor.get(path)
+
+    assert response.headers.get("x-cache") == "HIT"
+    return response
+
+
+def _create_post(logged_in_page, base_url):
+    """Create a post through the form, return its data and path."""
+    post = PostData.generate()
+    CreatePostPage(logged_in_page, base_url).navigate().create_post(post)
+
+    list_page = PostListPage(logged_in_page, base_url)
+    list_page.navigate(LISTING_PATH)
+    return post, list_page.get_post_path(post.title)
+
+
+class TestPageCacheHits:
+    """Tests for serving repeated anonymous requests from the page cache."""
+
+    def test_anonymous_listing_is_served_from_cache(self, visitor):
+        """Test that the second anonymous request of a listing is a cache hit."""
+        response = _warm(visitor, LISTING_PATH)
+
+        assert response.ok
+
+    def test_logged_in_listing_is_not_cached(self, logged_in_page):
+        """Test that logged in requests bypass the page cache."""
+        logged_in_page.request.get(LISTING_PATH)
+        response = logged_in_page.request.get(LISTING_PATH)
+
+        assert response.headers.get("x-cache") is None
+
+
+class TestPageCacheInvalidation:
+    """Tests for dropping cached pages when posts and comments are created."""
+
+    def test_new_post_invalidates_listing(self, visitor, logged_in_page, flask_server):
+        """Test that a created post shows on a listing that was cached before."""
+        _warm(visitor, LISTING_PATH)
+
+        post, _ = _create_post(logged_in_page, flask_server["base_url"])
+        response = visitor.get(LISTING_PATH)
+
+        assert response.headers.get("x-cache") == "MISS"
+        assert post.title in response.text()
+
+    def test_new_comment_invalidates_post_page(
+        self, visitor, logged_in_page, flask_server
+    ):
+        """Test that a comment shows on a post page that was cached before."""
+        base_url = flask_server["base_url"]
+        _, post_path = _create_post(logged_in_page, base_url)
+        _warm(visitor, post_path)
+
+        comment = f"Comment from the page cache test {uuid.uuid4().hex[:8]}"
+        post_page = PostPage(logged_in_page, base_url)
+        post_page.navigate(post_path).add_comment(comment)
+        post_page.expect_success_flash()
+        response = visitor.get(post_path)
+
+        assert response.headers.get("x-cache") == "MISS"
+        assert comment in response.text()
@@ -0,0 +1,100 @@
+"""
+E2E tests for the cursor pagination of the home and category listings.
+"""
+
+import uuid
+from collections import Counter
+
+import pytest
+
+from tests.e2e.helpers.database_helpers import create_test_post
+from tests.e2e.pages.post_list_page import PostListPage
+
+SORT_OPTIONS = ["asc", "desc"]
+CATEGORY_BY_OPTIONS = [
+    "time_stamp",
+    "title",
+    "views",
+    "category",
+    "last_edit_time_stamp",
+]
+INDEX_BY_OPTIONS = [*CATEGORY_BY_OPTIONS, "hot"]
+
+CATEGORY = "History"
+POST_COUNT = 30
+
+
+@pytest.fixture(scope="module")
+def paginated_posts(db_path):
+    """
+    Create POST_COUNT posts in CATEGORY spanning several pages.
+    Sort values repeat so ties are broken by id, and most posts have a NULL
+    edit time and some a NULL creation time or views, like rows brought in by
+    migrate_data.py.
+    Returns the url_ids of the created posts.
+    """
+    author = f"testuser_{uuid.uuid4().hex[:8]}"
+
+    return [
+        create_test_post(
+            db_path=str(db_path),
+            title=f"Pagination {uuid.uuid4().hex[:8]} {index:02d}",
+            author=author,
+            category=CATEGORY,
+            views=None if index % 4 == 0 else index % 5,
+            time_stamp=None if index % 6 == 0 else 1_600_000_000 + index % 7,
+            last_edit_time_stamp=None if index < 18 else 1_700_000_000 + index % 3,
+        )
+        for index in range(POST_COUNT)
+    ]
+
+
+def _expect_each_post_once(collected, posts):
+    counts = Counter(collected)
+    skipped = [url_id for url_id in posts if counts[url_id] == 0]
+    repeated = [url_id for url_id in posts if counts[url_id] > 1]
+
+    assert not skipped, f"{len(skipped)} posts were never listed: {skipped}"
+    assert not repeated, f"{len(repeated)} posts were listed twice: {repeated}"
+
+
+class TestIndexPagination:
+    """Tests for paging through the home page listing."""
+
+    @pytest.mark.parametrize("sort", SORT_OPTIONS)
+    @pytest.mark.parametrize("by", INDEX_BY_OPTIONS)
+    def test_index_pages_list_every_post_once(
+        self, logged_in_page, flask_server, paginated_posts, by, sort
+    ):
+        """Test that following next links lists every post exactly once."""
+        list_page = PostListPage(logged_in_page, flask_server["base_url"])
+        collected = list_page.collect_post_url_ids(f"/by={by}/sort={sort}")
+
+        _expect_each_post_once(collected, paginated_posts)
+
+
+class TestCategoryPagination:
+    """Tests for paging through a category listing."""
+
+    @pytest.mark.parametrize("sort", SORT_OPTIONS)
+    @pytest.mark.parametrize("by", CATEGORY_BY_OPTIONS)
+    def test_category_pages_list_every_post_once(
+        self, logged_in_page, flask_server, paginated_posts, by, sort
+    ):
+        """Test that following next links lists every category post exactly once."""
+        list_page = PostListPage(logged_in_page, flask_server["base_url"])
+        collected = list_page.collect_post_url_ids(
+            f"/category/{CATEGORY.lower()}/by={by}/sort={sort}"
+        )
+
+        _expect_each_post_once(collected, paginated_posts)
+
+    def test_category_pages_list_no_post_twice(
+        self, logged_in_page, flask_server, paginated_posts
+    ):
+        """Test that the default category listing repeats no post across pages."""
+        list_page = PostListPage(logged_in_page, flask_server["base_url"])
+        collected = list_page.collect_post_url_ids(f"/category/{CATEGORY.lower()}")
+
+        assert len(collected) == len(set(collected))
+        assert len(collected) >= POST_COUNT
@@ -0,0 +1,126 @@
+"""
+E2E tests for the buffered post view counter and the hot scores it refreshes.
+"""
+
+import time
+import uuid
+
+import pytest
+
+from tests.e2e.helpers.database_helpers import create_test_post, get_post_by_url_id
+from tests.e2e.pages.post_list_page import PostListPage
+from tests.e2e.pages.post_page import PostPage
+
+# Views are written every VIEW_COUNT_FLUSH_INTERVAL (10) seconds.
+FLUSH_TIMEOUT = 30
+
+
+@pytest.fixture(scope="function")
+def posts_without_time_stamp(db_path):
+    """
+    Create a post with a NULL creation time and views, like rows brought in
+    by migrate_data.py, next to a post with both set.
+    Returns the url_ids of both posts.
+    """
+    author = f"testuser_{uuid.uuid4().hex[:8]}"
+
+    legacy = create_test_post(
+        db_path=str(db_path),
+        title=f"Views {uuid.uuid4().hex[:8]} legacy",
+        author=author,
+        views=None,
+        time_stamp=None,
+    )
+    current = create_test_post(
+        db_path=str(db_path),
+        title=f"Views {uuid.uuid4().hex[:8]} current",
+        author=author,
+        views=3,
+    )
+
+    return legacy, current
+
+
+def _view(page, base_url, url_id):
+    """Open the post page once, which records one view."""
+    PostPage(page, base_url).navigate(f"/post/{url_id}")
+
+
+def _wait_for_post(db_path, url_id, condition):
+    """Wait until the post row meets condition after a flush, return the row."""
+    deadline = time.monotonic() + FLUSH_TIMEOUT
+
+    while True:
+        post = get_post_by_url_id(str(db_path), url_id)
+        if condition(post) or time.monotonic() > deadline:
+            return post
+
+        time.sleep(0.5)
+
+
+def _wait_for_views(db_path, url_id, views):
+    return _wait_for_post(db_path, url_id, lambda post: (post["views"] or 0) >= views)
+
+
+def _wait_for_hot_score(db_path, url_id):
+    return _wait_for_post(db_path, url_id, lambda post: post["hot_score"] > 0)
+
+
+class TestViewCounting:
+    """Tests for writing buffered views of posts without a creation time."""
+
+    def test_view_of_post_without_time_stamp_is_counted(
+        self, logged_in_page, flask_server, db_path, posts_without_time_stamp
+    ):
+        """Test that a view of a NULL time_stamp post reaches the database."""
+        legacy, _ = posts_without_time_stamp
+
+        _view(logged_in_page, flask_server["base_url"], legacy)
+        post = _wait_for_views(db_path, legacy, 1)
+
+        assert post["views"] == 1
+        assert post["time_stamp"] is None
+
+    def test_views_flushed_with_post_without_time_stamp_are_counted(
+        self, logged_in_page, flask_server, db_path, posts_without_time_stamp
+    ):
+        """Test that a NULL time_stamp post doesn't lose the views flushed with it."""
+        legacy, current = posts_without_time_stamp
+
+        _view(logged_in_page, flask_server["base_url"], legacy)
+        _view(logged_in_page, flask_server["base_url"], current)
+
+        assert _wait_for_views(db_path, legacy, 1)["views"] == 1
+        assert _wait_for_views(db_path, current, 4)["views"] == 4
+
+    def test_hot_score_of_post_without_time_stamp_is_refreshed(
+        self, logged_in_page, flask_server, db_path, posts_without_time_stamp
+    ):
+        """Test that the flush scores a viewed NULL time_stamp post as new."""
+        legacy, _ = posts_without_time_stamp
+
+        _view(logged_in_page, flask_server["base_url"], legacy)
+        post = _wait_for_hot_score(db_path, legacy)
+
+        assert post["views"] == 1
+        assert post["hot_score"] > 0
+
+
+class TestHotListing:
+    """Tests for listing viewed posts without a creation time by hot score."""
+
+    @pytest.mark.parametrize("sort", ["asc", "desc"])
+    def test_viewed_post_without_time_stamp_is_listed_once(
+        self, logged_in_page, flask_server, db_path, posts_without_time_stamp, sort
+    ):
+        """Test that hot cursor pages list a scored NULL time_stamp post once."""
+        legacy, current = posts_without_time_stamp
+
+        _view(logged_in_page, flask_server["base_url"], legacy)
+        _wait_for_hot_score(db_path, legacy)
+
+        list_page = PostListPage(logged_in_page, flask_server["base_url"])
+        collected = list_page.collect_post_url_ids(f"/by=hot/sort={sort}")
+
+        assert collected.count(legacy) == 1
+        assert collected.count(current) == 1